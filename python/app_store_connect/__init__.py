@@ -6,7 +6,7 @@ A comprehensive Python wrapper for automating App Store Connect operations.
 
 __version__ = "0.1.0"
 
-from .client import Client
+from .client import Client, BatchOp, BatchResult, VersionBundle
 from .auth import Auth
 from .exceptions import (
     AppStoreConnectError,
@@ -18,10 +18,26 @@ from .exceptions import (
 
 __all__ = [
     "Client",
+    "AsyncClient",
+    "BatchOp",
+    "BatchResult",
+    "VersionBundle",
     "Auth",
     "AppStoreConnectError",
     "AuthenticationError",
     "RateLimitError",
     "NotFoundError",
     "ValidationError",
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    # AsyncClient pulls in its HTTP transport, so load it only when asked for
+    if name == "AsyncClient":
+        from .async_client import AsyncClient
+        globals()[name] = AsyncClient
+        return AsyncClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
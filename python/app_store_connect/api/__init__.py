@@ -1,18 +1,42 @@
 """
 App Store Connect API modules
+
+Submodules are imported on first attribute access so importing the
+package does not load every API module up front.
 """
 
-from .apps import AppsAPI
-from .localizations import LocalizationsAPI, AppStoreVersionLocalizationsAPI
-from .versions import VersionsAPI
-from .media import MediaAPI
-from .categories import CategoriesAPI
+import importlib
+
+_LAZY = {
+    "AppsAPI": ".apps",
+    "LocalizationsAPI": ".localizations",
+    "AppStoreVersionLocalizationsAPI": ".localizations",
+    "BulkResult": ".localizations",
+    "VersionsAPI": ".versions",
+    "MediaAPI": ".media",
+    "CategoriesAPI": ".categories",
+}
 
 __all__ = [
     "AppsAPI",
     "LocalizationsAPI",
     "AppStoreVersionLocalizationsAPI",
+    "BulkResult",
     "VersionsAPI",
     "MediaAPI",
     "CategoriesAPI",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,15 +2,69 @@
 Apps API module for App Store Connect
 """
 
-from typing import Dict, Any, Optional, List
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterator
+import requests
+from ..auth import Auth
 from ..base import BaseAPI
 
 
+class BoundApp:
+    """
+    App-scoped view of AppsAPI with its endpoint paths built once
+    
+    Example:
+        >>> app = client.apps.bind('app123')
+        >>> infos = app.app_infos()
+    """
+    
+    def __init__(self, api: 'AppsAPI', app_id: str):
+        """
+        Initialize bound app
+        
+        Args:
+            api: The AppsAPI instance to issue requests through
+            app_id: The app ID
+        """
+        self.api = api
+        self.app_id = app_id
+        
+        prefix = f'apps/{app_id}/'
+        self._app_infos_path = sys.intern(prefix + 'appInfos')
+        self._versions_path = sys.intern(prefix + 'appStoreVersions')
+        self._builds_path = sys.intern(prefix + 'builds')
+    
+    def app_infos(self) -> List[Dict[str, Any]]:
+        """Get app info records for the app"""
+        return self.api._list(self._app_infos_path)
+    
+    def versions(self) -> List[Dict[str, Any]]:
+        """Get app store versions for the app"""
+        return self.api._list(self._versions_path)
+    
+    def builds(self) -> List[Dict[str, Any]]:
+        """Get builds for the app"""
+        return self.api._list(self._builds_path)
+
+
 class AppsAPI(BaseAPI):
     """
     Manage apps in App Store Connect
     """
     
+    def __init__(self, auth: Auth, session: Optional[requests.Session] = None):
+        """
+        Initialize apps API
+        
+        Args:
+            auth: Authentication instance
+            session: Shared session (default: a new one)
+        """
+        super().__init__(auth, session)
+        # app_id -> BoundApp handed out by bind()
+        self._bound: Dict[str, BoundApp] = {}
+    
     def get_all(self, limit: int = 200) -> List[Dict[str, Any]]:
         """
         Get all apps
@@ -21,7 +75,37 @@ class AppsAPI(BaseAPI):
         Returns:
             List of app data
         """
-        return self.get_all_pages('apps', limit=limit)
+        return list(self.iter_all(limit))
+    
+    def iter_all(self, limit: int = 200) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all apps page by page
+        
+        The next page is fetched in the background while the caller
+        consumes the current one, and only one page is held at a time.
+        
+        Args:
+            limit: Number of results per page (max 200)
+            
+        Yields:
+            App data
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future: Optional[Future] = executor.submit(
+                self.get, 'apps', params={'limit': min(limit, 200)}
+            )
+            
+            while future is not None:
+                response = future.result()
+                
+                next_url = response.get('links', {}).get('next')
+                if next_url:
+                    # Next URL already carries the query params
+                    future = executor.submit(self.get, next_url.replace(self.BASE_URL, ''))
+                else:
+                    future = None
+                
+                yield from response.get('data', [])
     
     def get_app(self, app_id: str) -> Dict[str, Any]:
         """
@@ -33,8 +117,7 @@ class AppsAPI(BaseAPI):
         Returns:
             App data
         """
-        response = self.get(f'apps/{app_id}')
-        return response['data']
+        return self._item(f'apps/{app_id}')
     
     def get_by_bundle_id(self, bundle_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -46,8 +129,7 @@ class AppsAPI(BaseAPI):
         Returns:
             App data or None if not found
         """
-        response = self.get('apps', params={'filter[bundleId]': bundle_id})
-        data = response.get('data', [])
+        data = self._list('apps', params={'filter[bundleId]': bundle_id})
         return data[0] if data else None
     
     def update(self, app_id: str, **attributes) -> Dict[str, Any]:
@@ -71,6 +153,31 @@ class AppsAPI(BaseAPI):
         response = super().patch(f'apps/{app_id}', data=data)
         return response['data']
     
+    def get_with_relations(self, app_id: str, includes: List[str]) -> Dict[str, Any]:
+        """
+        Get an app and related resources in a single request
+        
+        Uses the JSON:API ``include`` parameter so related records come back
+        in the same response instead of one request per relationship.
+        
+        Args:
+            app_id: The app ID
+            includes: Relationships to include (e.g., ['appInfos', 'appStoreVersions'])
+            
+        Returns:
+            Dict with the app under 'data' and a list of records for each
+            included resource type (e.g., result['appInfos'])
+        """
+        response = super().get(f'apps/{app_id}', params={'include': ','.join(includes)})
+        
+        result = {'data': response['data']}
+        for include in includes:
+            result[include] = []
+        for item in response.get('included', []):
+            result.setdefault(item['type'], []).append(item)
+        
+        return result
+    
     def get_app_infos(self, app_id: str) -> List[Dict[str, Any]]:
         """
         Get app info records for an app
@@ -81,8 +188,7 @@ class AppsAPI(BaseAPI):
         Returns:
             List of app info data
         """
-        response = super().get(f'apps/{app_id}/appInfos')
-        return response.get('data', [])
+        return self._list(f'apps/{app_id}/appInfos')
     
     def get_app_store_versions(self, app_id: str) -> List[Dict[str, Any]]:
         """
@@ -94,8 +200,7 @@ class AppsAPI(BaseAPI):
         Returns:
             List of app store version data
         """
-        response = super().get(f'apps/{app_id}/appStoreVersions')
-        return response.get('data', [])
+        return self._list(f'apps/{app_id}/appStoreVersions')
     
     def get_builds(self, app_id: str) -> List[Dict[str, Any]]:
         """
@@ -107,5 +212,21 @@ class AppsAPI(BaseAPI):
         Returns:
             List of build data
         """
-        response = super().get(f'apps/{app_id}/builds')
-        return response.get('data', [])
\ No newline at end of file
+        return self._list(f'apps/{app_id}/builds')
+    
+    def bind(self, app_id: str) -> BoundApp:
+        """
+        Get an app-scoped view for repeated calls against one app
+        
+        Repeated calls with the same app ID return the same object.
+        
+        Args:
+            app_id: The app ID
+            
+        Returns:
+            BoundApp with app_infos(), versions() and builds()
+        """
+        bound = self._bound.get(app_id)
+        if bound is None:
+            bound = self._bound.setdefault(app_id, BoundApp(self, app_id))
+        return bound
\ No newline at end of file
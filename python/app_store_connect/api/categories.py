@@ -3,10 +3,34 @@ App Categories API module for App Store Connect
 Manages primary and secondary app categories
 """
 
-from typing import Dict, Any, List, Optional
+import sys
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple, ClassVar, NamedTuple
 from ..base import BaseAPI
 
 
+# Query parameters that never change; shared read-only across calls
+_APP_INFO_CATEGORY_PARAMS = MappingProxyType({
+    'fields[appInfos]': (
+        'primaryCategory,secondaryCategory,primarySubcategoryOne,primarySubcategoryTwo,'
+        'secondarySubcategoryOne,secondarySubcategoryTwo'
+    ),
+    'fields[appCategories]': 'platforms,parent',
+    # Sideload parent categories too so no follow-up lookup is needed
+    'include': 'primaryCategory,primaryCategory.parent,secondaryCategory,secondaryCategory.parent'
+})
+
+
+class _CategorySet(NamedTuple):
+    """Fetched categories for one platform plus their lookup indexes"""
+    expires_at: float
+    categories: List[Dict[str, Any]]
+    by_name: Dict[str, Dict[str, Any]]
+    by_id: Dict[str, Dict[str, Any]]
+
+
 class CategoriesAPI(BaseAPI):
     """
     Manage app categories and subcategories in App Store Connect
@@ -14,7 +38,7 @@ class CategoriesAPI(BaseAPI):
     
     # Available App Store Categories
     # Reference: https://developer.apple.com/app-store/categories/
-    CATEGORIES = {
+    CATEGORIES = MappingProxyType({
         'BOOKS': 'Books',
         'BUSINESS': 'Business', 
         'DEVELOPER_TOOLS': 'Developer Tools',
@@ -40,10 +64,10 @@ class CategoriesAPI(BaseAPI):
         'TRAVEL': 'Travel',
         'UTILITIES': 'Utilities',
         'WEATHER': 'Weather'
-    }
+    })
     
     # Game Subcategories
-    GAME_SUBCATEGORIES = {
+    GAME_SUBCATEGORIES = MappingProxyType({
         'ACTION': 'Action',
         'ADVENTURE': 'Adventure',
         'ARCADE': 'Arcade',
@@ -63,10 +87,10 @@ class CategoriesAPI(BaseAPI):
         'STRATEGY': 'Strategy',
         'TRIVIA': 'Trivia',
         'WORD': 'Word'
-    }
+    })
     
     # Magazines & Newspapers Subcategories
-    NEWSSTAND_SUBCATEGORIES = {
+    NEWSSTAND_SUBCATEGORIES = MappingProxyType({
         'ARTS_AND_PHOTOGRAPHY': 'Arts & Photography',
         'AUTOMOTIVE': 'Automotive',
         'BRIDES_AND_WEDDINGS': 'Brides & Weddings',
@@ -95,7 +119,57 @@ class CategoriesAPI(BaseAPI):
         'TEENS': 'Teens',
         'TRAVEL_AND_REGIONAL': 'Travel & Regional',
         'WOMENS_INTEREST': "Women's Interest"
-    }
+    })
+    
+    # Reverse lookups (display name -> key), built once at import
+    _CATEGORIES_BY_NAME = MappingProxyType({v: k for k, v in CATEGORIES.items()})
+    _GAME_SUBCATS_BY_NAME = MappingProxyType({v: k for k, v in GAME_SUBCATEGORIES.items()})
+    _NEWSSTAND_SUBCATS_BY_NAME = MappingProxyType(
+        {v: k for k, v in NEWSSTAND_SUBCATEGORIES.items()}
+    )
+    
+    # Key sets for validation, which only needs membership
+    _CATEGORY_KEYS = frozenset(CATEGORIES)
+    _GAME_SUBCATEGORY_KEYS = frozenset(GAME_SUBCATEGORIES)
+    _NEWSSTAND_SUBCATEGORY_KEYS = frozenset(NEWSSTAND_SUBCATEGORIES)
+    
+    # Seconds the category list is reused before refetching
+    CATEGORIES_CACHE_TTL = 3600
+    
+    # (base URL, platform) -> categories, shared by every CategoriesAPI in the process
+    _shared_cache: ClassVar[Dict[Tuple[str, str], _CategorySet]] = {}
+    _shared_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    @classmethod
+    def category_key_from_name(cls, name: str) -> Optional[str]:
+        """
+        Get the category key for a display name
+        
+        Args:
+            name: Category display name (e.g., 'Photo & Video')
+            
+        Returns:
+            Category key (e.g., 'PHOTO_AND_VIDEO') or None if unknown
+        """
+        return cls._CATEGORIES_BY_NAME.get(name)
+    
+    @classmethod
+    def subcategory_key_from_name(cls, name: str, category: str = 'GAMES') -> Optional[str]:
+        """
+        Get the subcategory key for a display name
+        
+        Args:
+            name: Subcategory display name (e.g., 'Role Playing')
+            category: Parent category key - GAMES or MAGAZINES_AND_NEWSPAPERS (default: GAMES)
+            
+        Returns:
+            Subcategory key (e.g., 'ROLE_PLAYING') or None if unknown
+        """
+        if category == 'GAMES':
+            return cls._GAME_SUBCATS_BY_NAME.get(name)
+        if category == 'MAGAZINES_AND_NEWSPAPERS':
+            return cls._NEWSSTAND_SUBCATS_BY_NAME.get(name)
+        raise ValueError(f"Category has no subcategories: {category}")
     
     def get_app_categories(self, app_info_id: str) -> Dict[str, Any]:
         """
@@ -108,12 +182,7 @@ class CategoriesAPI(BaseAPI):
             Dictionary containing primary and secondary category information
         """
         endpoint = f'appInfos/{app_info_id}'
-        params = {
-            'fields[appInfos]': 'primaryCategory,secondaryCategory,primarySubcategoryOne,primarySubcategoryTwo,secondarySubcategoryOne,secondarySubcategoryTwo',
-            'include': 'primaryCategory,secondaryCategory'
-        }
-        
-        response = super().get(endpoint, params=params)
+        response = super().get(endpoint, params=_APP_INFO_CATEGORY_PARAMS)
         app_info = response.get('data', {})
         
         # Extract category relationships
@@ -121,46 +190,59 @@ class CategoriesAPI(BaseAPI):
         included = response.get('included', [])
         
         # Build category lookup from included data
-        category_lookup = {}
-        for item in included:
-            if item.get('type') == 'appCategories':
-                category_lookup[item['id']] = item['attributes']
-        
-        # Extract current categories
-        result = {
-            'primaryCategory': None,
-            'secondaryCategory': None,
-            'primarySubcategoryOne': None,
-            'primarySubcategoryTwo': None,
-            'secondarySubcategoryOne': None,
-            'secondarySubcategoryTwo': None
+        category_lookup = {
+            item['id']: item for item in included if item.get('type') == 'appCategories'
         }
         
-        # Get primary category
-        primary_cat = relationships.get('primaryCategory', {}).get('data')
-        if primary_cat:
-            result['primaryCategory'] = {
-                'id': primary_cat['id'],
-                'attributes': category_lookup.get(primary_cat['id'], {})
-            }
+        result = {}
         
-        # Get secondary category
-        secondary_cat = relationships.get('secondaryCategory', {}).get('data')
-        if secondary_cat:
-            result['secondaryCategory'] = {
-                'id': secondary_cat['id'],
-                'attributes': category_lookup.get(secondary_cat['id'], {})
-            }
+        # Resolve primary and secondary categories from relationships
+        for key in ('primaryCategory', 'secondaryCategory'):
+            linkage = relationships.get(key)
+            category = linkage.get('data') if linkage else None
+            result[key] = (
+                self._resolve_category(category['id'], category_lookup) if category else None
+            )
         
         # Get subcategories from attributes
         attributes = app_info.get('attributes', {})
-        result['primarySubcategoryOne'] = attributes.get('primarySubcategoryOne')
-        result['primarySubcategoryTwo'] = attributes.get('primarySubcategoryTwo')
-        result['secondarySubcategoryOne'] = attributes.get('secondarySubcategoryOne')
-        result['secondarySubcategoryTwo'] = attributes.get('secondarySubcategoryTwo')
+        for key in ('primarySubcategoryOne', 'primarySubcategoryTwo',
+                    'secondarySubcategoryOne', 'secondarySubcategoryTwo'):
+            result[key] = attributes.get(key)
         
         return result
     
+    @staticmethod
+    def _resolve_category(
+        category_id: str,
+        category_lookup: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Build a category entry from sideloaded records, with its parent if any
+        
+        Args:
+            category_id: The category ID
+            category_lookup: Included appCategories records keyed by ID
+            
+        Returns:
+            Dict with 'id', 'attributes' and, for subcategories, 'parent'
+        """
+        item = category_lookup.get(category_id, {})
+        category = {
+            'id': category_id,
+            'attributes': item.get('attributes', {})
+        }
+        
+        parent_linkage = item.get('relationships', {}).get('parent')
+        parent = parent_linkage.get('data') if parent_linkage else None
+        if parent:
+            category['parent'] = {
+                'id': parent['id'],
+                'attributes': category_lookup.get(parent['id'], {}).get('attributes', {})
+            }
+        
+        return category
+    
     def update_app_categories(
         self,
         app_info_id: str,
@@ -184,7 +266,7 @@ class CategoriesAPI(BaseAPI):
             secondary_subcategory_two: Second subcategory for secondary category
             
         Returns:
-            Updated app info data
+            Updated app info data, or {} if nothing was given to change
             
         Note:
             - Primary category is required for all apps
@@ -192,41 +274,32 @@ class CategoriesAPI(BaseAPI):
             - Subcategories are only applicable for Games and Magazines & Newspapers categories
             - You can have up to 2 subcategories per category
         """
+        subcategories = (
+            ('primarySubcategoryOne', primary_subcategory_one),
+            ('primarySubcategoryTwo', primary_subcategory_two),
+            ('secondarySubcategoryOne', secondary_subcategory_one),
+            ('secondarySubcategoryTwo', secondary_subcategory_two)
+        )
+        categories = (
+            ('primaryCategory', primary_category_id),
+            ('secondaryCategory', secondary_category_id)
+        )
+        
         data = {
             'data': {
                 'type': 'appInfos',
                 'id': app_info_id,
-                'attributes': {},
-                'relationships': {}
-            }
-        }
-        
-        # Add subcategories to attributes if provided
-        if primary_subcategory_one is not None:
-            data['data']['attributes']['primarySubcategoryOne'] = primary_subcategory_one
-        if primary_subcategory_two is not None:
-            data['data']['attributes']['primarySubcategoryTwo'] = primary_subcategory_two
-        if secondary_subcategory_one is not None:
-            data['data']['attributes']['secondarySubcategoryOne'] = secondary_subcategory_one
-        if secondary_subcategory_two is not None:
-            data['data']['attributes']['secondarySubcategoryTwo'] = secondary_subcategory_two
-        
-        # Add category relationships if provided
-        if primary_category_id:
-            data['data']['relationships']['primaryCategory'] = {
-                'data': {
-                    'type': 'appCategories',
-                    'id': primary_category_id
+                'attributes': {key: value for key, value in subcategories if value is not None},
+                'relationships': {
+                    key: {'data': {'type': 'appCategories', 'id': category_id}}
+                    for key, category_id in categories if category_id
                 }
             }
+        }
         
-        if secondary_category_id:
-            data['data']['relationships']['secondaryCategory'] = {
-                'data': {
-                    'type': 'appCategories',
-                    'id': secondary_category_id
-                }
-            }
+        if not data['data']['attributes'] and not data['data']['relationships']:
+            # Nothing to change; skip the empty PATCH
+            return {}
         
         response = super().patch(f'appInfos/{app_info_id}', data=data)
         return response.get('data', {})
@@ -241,16 +314,58 @@ class CategoriesAPI(BaseAPI):
         Returns:
             List of available categories with their IDs and attributes
         """
+        return self._get_category_set(platform).categories
+    
+    def _get_category_set(self, platform: str) -> _CategorySet:
+        """
+        Get categories and lookup indexes for a platform, fetching on first use
+        
+        The category taxonomy rarely changes, so one fetch is shared by all
+        instances for CATEGORIES_CACHE_TTL seconds.
+        """
+        key = (self.BASE_URL, platform)
+        with self._shared_cache_lock:
+            cached = self._shared_cache.get(key)
+        if cached and time.monotonic() < cached.expires_at:
+            return cached
+        
         endpoint = 'appCategories'
         params = {
             'filter[platforms]': platform,
             'limit': 200  # Get all categories
         }
         
-        response = super().get(endpoint, params=params)
-        return response.get('data', [])
+        # Categories rarely change, so a refresh is usually a 304 with no body
+        response = super().get(endpoint, params=params, use_etag=True)
+        categories = response.get('data', [])
+        
+        # appCategories carry no display name, so names come from CATEGORIES,
+        # whose keys are the top-level category IDs
+        by_name = {}
+        by_id = {}
+        for category in categories:
+            category_id = sys.intern(category['id'])
+            by_id[category_id] = category
+            display_name = self.CATEGORIES.get(category_id)
+            if display_name is not None:
+                by_name[display_name] = category
+        
+        category_set = _CategorySet(
+            time.monotonic() + self.CATEGORIES_CACHE_TTL, categories, by_name, by_id
+        )
+        with self._shared_cache_lock:
+            self._shared_cache[key] = category_set
+        return category_set
+    
+    @classmethod
+    def invalidate_categories_cache(cls):
+        """Forget cached category lists so the next lookup refetches them"""
+        with cls._shared_cache_lock:
+            cls._shared_cache.clear()
     
-    def get_category_by_name(self, category_name: str, platform: str = 'IOS') -> Optional[Dict[str, Any]]:
+    def get_category_by_name(
+        self, category_name: str, platform: str = 'IOS'
+    ) -> Optional[Dict[str, Any]]:
         """
         Find a category by its display name
         
@@ -261,14 +376,22 @@ class CategoriesAPI(BaseAPI):
         Returns:
             Category data if found, None otherwise
         """
-        categories = self.get_all_categories(platform)
-        
-        for category in categories:
-            # Check against the display name in attributes
-            if category.get('attributes', {}).get('displayName') == category_name:
-                return category
+        return self._get_category_set(platform).by_name.get(category_name)
+    
+    def get_category_by_id(
+        self, category_id: str, platform: str = 'IOS'
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a category by its ID
         
-        return None
+        Args:
+            category_id: The category ID (e.g., 'PHOTO_AND_VIDEO', 'GAMES')
+            platform: Platform filter - IOS, MAC_OS, TV_OS (default: IOS)
+            
+        Returns:
+            Category data if found, None otherwise
+        """
+        return self._get_category_set(platform).by_id.get(category_id)
     
     def set_photo_video_category(self, app_info_id: str) -> Dict[str, Any]:
         """
@@ -310,10 +433,10 @@ class CategoriesAPI(BaseAPI):
             raise ValueError("Games category not found")
         
         # Validate subcategories
-        if game_subcategory_one not in self.GAME_SUBCATEGORIES:
+        if game_subcategory_one not in self._GAME_SUBCATEGORY_KEYS:
             raise ValueError(f"Invalid game subcategory: {game_subcategory_one}")
         
-        if game_subcategory_two and game_subcategory_two not in self.GAME_SUBCATEGORIES:
+        if game_subcategory_two and game_subcategory_two not in self._GAME_SUBCATEGORY_KEYS:
             raise ValueError(f"Invalid game subcategory: {game_subcategory_two}")
         
         return self.update_app_categories(
@@ -2,8 +2,147 @@
 App Info Localizations API module for App Store Connect
 """
 
-from typing import Dict, Any, List, Optional
+import sys
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Dict, Any, List, Optional, Tuple, Callable, Iterator, TypeVar
+import requests
+from ..auth import Auth
 from ..base import BaseAPI
+from ..exceptions import AppStoreConnectError, RateLimitError
+
+
+# Times a rate-limited request is retried before reporting failure
+MAX_RATE_LIMIT_RETRIES = 3
+
+_T = TypeVar('_T')
+
+# (locale, action, call) row for _run_bulk; a call of None sends nothing
+_BulkTask = Tuple[str, str, Optional[Callable[[], Dict[str, Any]]]]
+
+
+def _call_with_retry(call: Callable[[], _T]) -> _T:
+    """Make one request, retrying after 429 responses"""
+    for attempt in range(MAX_RATE_LIMIT_RETRIES):
+        try:
+            return call()
+        except RateLimitError as e:
+            # A Retry-After already paused the shared limiter the retry goes
+            # through; without one, back off exponentially
+            if e.retry_after is None:
+                time.sleep(2 ** attempt)
+    # Last attempt; its RateLimitError reaches the caller
+    return call()
+
+
+def _changed_attributes(
+    attributes: Dict[str, Any],
+    current: Dict[str, Any],
+    arg_keys: Dict[str, str]
+) -> Dict[str, Any]:
+    """
+    Drop attributes whose value already matches the remote record
+    
+    Args:
+        attributes: update() keyword arguments for one locale
+        current: The existing record's 'attributes'
+        arg_keys: Map of keyword argument name to API attribute name
+        
+    Returns:
+        The keyword arguments that would change something
+    """
+    return {
+        arg: value for arg, value in attributes.items()
+        if value is not None and current.get(arg_keys.get(arg, arg)) != value
+    }
+
+
+@dataclass(eq=False)
+class BulkResult(Mapping):
+    """
+    Per-locale outcome of a bulk update, stored column-wise
+    
+    Behaves as a read-only mapping of locale to the legacy result dict
+    ({'success': True, 'action': ..., 'data': ...} or
+    {'success': False, 'error': ...}), so existing callers keep working.
+    """
+    locales: List[str] = field(default_factory=list)
+    successes: List[bool] = field(default_factory=list)
+    # 'created', 'updated', 'noop' (nothing given) or 'unchanged' (remote already matched)
+    actions: List[str] = field(default_factory=list)
+    # Response data on success, error message on failure
+    data: List[Any] = field(default_factory=list)
+    # locale -> row, built once; rows are filled in place but never added
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        for i, locale in enumerate(self.locales):
+            self._index.setdefault(locale, i)
+    
+    def failed(self) -> List[str]:
+        """Get the locales whose request failed"""
+        return [locale for locale, ok in zip(self.locales, self.successes) if not ok]
+    
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Get the results as a plain {locale: result} dict"""
+        return {locale: self[locale] for locale in self.locales}
+    
+    def __getitem__(self, locale: str) -> Dict[str, Any]:
+        i = self._index[locale]
+        
+        if self.successes[i]:
+            return {'success': True, 'action': self.actions[i], 'data': self.data[i]}
+        return {'success': False, 'error': self.data[i]}
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.locales)
+    
+    def __len__(self) -> int:
+        return len(self.locales)
+
+
+def _run_bulk(
+    tasks: List[_BulkTask],
+    max_workers: int
+) -> BulkResult:
+    """
+    Run per-locale requests concurrently
+    
+    Args:
+        tasks: (locale, action, call) tuples; each call performs one request,
+            a call of None records a success without sending anything
+        max_workers: Maximum number of requests in flight
+        
+    Returns:
+        BulkResult with one row per task, in task order
+    """
+    result = BulkResult(
+        locales=[locale for locale, _, _ in tasks],
+        successes=[False] * len(tasks),
+        actions=[action for _, action, _ in tasks],
+        data=[None] * len(tasks)
+    )
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_call_with_retry, call): i
+            for i, (_, _, call) in enumerate(tasks) if call is not None
+        }
+        for i, (_, _, call) in enumerate(tasks):
+            if call is None:
+                result.successes[i] = True
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                result.data[i] = future.result()
+                result.successes[i] = True
+            except Exception as e:
+                result.data[i] = str(e)
+    
+    return result
 
 
 class LocalizationsAPI(BaseAPI):
@@ -11,9 +150,48 @@ class LocalizationsAPI(BaseAPI):
     Manage app info localizations in App Store Connect
     """
     
+    # JSON:API resource type and the parent relationship used on create
+    _TYPE = 'appInfoLocalizations'
+    _PARENT = ('appInfo', 'appInfos')
+    
+    # API attribute names, in the order of the create/update keyword arguments
+    _ATTRIBUTE_KEYS = ('name', 'subtitle', 'privacyPolicyUrl', 'privacyPolicyText')
+    _ARG_KEYS = dict(zip(
+        ('name', 'subtitle', 'privacy_policy_url', 'privacy_policy_text'),
+        _ATTRIBUTE_KEYS
+    ))
+    
+    # Concurrent requests used by bulk_update
+    max_workers = 8
+    
+    # Seconds bulk_update reuses the existing-localization map for an app info;
+    # a reused map only resolves IDs, fields are diffed against fresh records
+    EXISTING_CACHE_TTL = 60
+    
+    # Create several new locales with one JSON:API atomic operations request.
+    # App Store Connect does not document the extension, so this is opt-in;
+    # if the batch is rejected bulk_update falls back to one POST per locale.
+    use_atomic_operations = False
+    ATOMIC_OPERATIONS_ENDPOINT = 'operations'
+    ATOMIC_MEDIA_TYPE = 'application/vnd.api+json; ext="https://jsonapi.org/ext/atomic"'
+    # Statuses meaning the server does not support the atomic extension
+    ATOMIC_UNSUPPORTED_STATUSES = (400, 404, 415)
+    
+    def __init__(self, auth: Auth, session: Optional[requests.Session] = None):
+        """
+        Initialize localizations API
+        
+        Args:
+            auth: Authentication instance
+            session: Shared session (default: a new one)
+        """
+        super().__init__(auth, session)
+        # app_info_id -> (expires_at, {locale: localization})
+        self._existing_cache: Dict[str, Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+    
     def get_all(self, app_info_id: str) -> List[Dict[str, Any]]:
         """
-        Get all localizations for an app info
+        Get all localizations for an app info, following every page
         
         Args:
             app_info_id: The app info ID
@@ -21,8 +199,7 @@ class LocalizationsAPI(BaseAPI):
         Returns:
             List of localization data
         """
-        response = super().get(f'appInfos/{app_info_id}/appInfoLocalizations')
-        return response.get('data', [])
+        return self.get_all_pages(f'appInfos/{app_info_id}/appInfoLocalizations')
     
     def get(self, localization_id: str) -> Dict[str, Any]:
         """
@@ -60,34 +237,67 @@ class LocalizationsAPI(BaseAPI):
         Returns:
             Created localization data
         """
-        attributes = {'locale': locale}
-        if name:
-            attributes['name'] = name
-        if subtitle:
-            attributes['subtitle'] = subtitle
-        if privacy_policy_url:
-            attributes['privacyPolicyUrl'] = privacy_policy_url
-        if privacy_policy_text:
-            attributes['privacyPolicyText'] = privacy_policy_text
-        
-        data = {
-            'data': {
-                'type': 'appInfoLocalizations',
-                'attributes': attributes,
-                'relationships': {
-                    'appInfo': {
-                        'data': {
-                            'type': 'appInfos',
-                            'id': app_info_id
-                        }
-                    }
-                }
-            }
-        }
+        data = {'data': self._create_resource(
+            app_info_id, locale, name, subtitle, privacy_policy_url, privacy_policy_text
+        )}
         
         response = super().post('appInfoLocalizations', data=data)
         return response['data']
     
+    def create_many(
+        self,
+        app_info_id: str,
+        localizations: Dict[str, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several app info localizations in one atomic operations request
+        
+        Args:
+            app_info_id: The app info ID
+            localizations: Dict mapping locale to create() keyword arguments
+            
+        Returns:
+            Created localization data, in the order given
+        """
+        operations = [
+            {
+                'op': 'add',
+                'href': f'/{self._TYPE}',
+                'data': self._create_resource(app_info_id, locale, **attributes)
+            }
+            for locale, attributes in localizations.items()
+        ]
+        
+        response = super().post(
+            self.ATOMIC_OPERATIONS_ENDPOINT,
+            data={'atomic:operations': operations},
+            headers={'Content-Type': self.ATOMIC_MEDIA_TYPE, 'Accept': self.ATOMIC_MEDIA_TYPE}
+        )
+        return [result['data'] for result in response['atomic:results']]
+    
+    def _create_resource(
+        self,
+        app_info_id: str,
+        locale: str,
+        name: Optional[str] = None,
+        subtitle: Optional[str] = None,
+        privacy_policy_url: Optional[str] = None,
+        privacy_policy_text: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the resource object for a new localization"""
+        values = (name, subtitle, privacy_policy_url, privacy_policy_text)
+        attributes = {
+            'locale': locale,
+            **{key: value for key, value in zip(self._ATTRIBUTE_KEYS, values) if value}
+        }
+        
+        relationship, parent_type = self._PARENT
+        return {
+            'type': self._TYPE,
+            'attributes': attributes,
+            'relationships': {relationship: {'data': {'type': parent_type, 'id': app_info_id}}}
+        }
+    
     def update(
         self,
         localization_id: str,
@@ -107,26 +317,19 @@ class LocalizationsAPI(BaseAPI):
             privacy_policy_text: Privacy policy text
             
         Returns:
-            Updated localization data
-        """
-        attributes = {}
-        if name is not None:
-            attributes['name'] = name
-        if subtitle is not None:
-            attributes['subtitle'] = subtitle
-        if privacy_policy_url is not None:
-            attributes['privacyPolicyUrl'] = privacy_policy_url
-        if privacy_policy_text is not None:
-            attributes['privacyPolicyText'] = privacy_policy_text
-        
-        data = {
-            'data': {
-                'type': 'appInfoLocalizations',
-                'id': localization_id,
-                'attributes': attributes
-            }
+            Updated localization data, or {} if no attributes were given
+        """
+        values = (name, subtitle, privacy_policy_url, privacy_policy_text)
+        attributes = {
+            key: value for key, value in zip(self._ATTRIBUTE_KEYS, values) if value is not None
         }
         
+        if not attributes:
+            # Nothing to change; skip the empty PATCH
+            return {}
+        
+        data = {'data': {'type': self._TYPE, 'id': localization_id, 'attributes': attributes}}
+        
         response = super().patch(f'appInfoLocalizations/{localization_id}', data=data)
         return response['data']
     
@@ -138,6 +341,38 @@ class LocalizationsAPI(BaseAPI):
             localization_id: The localization ID
         """
         super().delete(f'appInfoLocalizations/{localization_id}')
+        
+        # Drop it from any cached existing-localization map
+        for _, existing_by_locale in self._existing_cache.values():
+            for locale, localization in list(existing_by_locale.items()):
+                if localization['id'] == localization_id:
+                    del existing_by_locale[locale]
+    
+    def _get_existing_by_locale(self, app_info_id: str) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+        """
+        Get existing localizations keyed by locale, reusing a recent fetch
+        
+        Args:
+            app_info_id: The app info ID
+            
+        Returns:
+            Dict mapping locale to localization data, and whether it was
+            just fetched (False when reused from the cache)
+        """
+        cached = self._existing_cache.get(app_info_id)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1], False
+        
+        # Interned so lookups against caller-supplied locales hit on identity
+        existing_by_locale = {
+            sys.intern(loc['attributes']['locale']): loc
+            for loc in self.get_all(app_info_id)
+        }
+        self._existing_cache[app_info_id] = (
+            time.monotonic() + self.EXISTING_CACHE_TTL,
+            existing_by_locale
+        )
+        return existing_by_locale, True
     
     def bulk_update(
         self,
@@ -147,6 +382,27 @@ class LocalizationsAPI(BaseAPI):
         """
         Bulk update localizations for an app
         
+        Args:
+            app_info_id: The app info ID
+            localizations: Dict mapping locale to attributes
+            
+        Returns:
+            Dict mapping locale to result, as {'success': True, 'action': ...,
+            'data': ...} or {'success': False, 'error': ...}
+        """
+        return self.bulk_update_result(app_info_id, localizations).as_dict()
+    
+    def bulk_update_result(
+        self,
+        app_info_id: str,
+        localizations: Dict[str, Dict[str, Any]]
+    ) -> BulkResult:
+        """
+        Bulk update like bulk_update, returning the column-wise BulkResult
+        
+        The result is a read-only Mapping with failed() and per-field
+        columns, and it holds fewer objects than the plain dict.
+        
         Args:
             app_info_id: The app info ID
             localizations: Dict mapping locale to attributes
@@ -156,43 +412,107 @@ class LocalizationsAPI(BaseAPI):
                 }
                 
         Returns:
-            Dict mapping locale to result (success/error)
+            BulkResult mapping locale to result (success/error)
         """
         # Get existing localizations
-        existing = self.get_all(app_info_id)
-        existing_by_locale = {
-            loc['attributes']['locale']: loc 
-            for loc in existing
-        }
-        
-        results = {}
+        existing_by_locale, fresh = self._get_existing_by_locale(app_info_id)
         
+        tasks: List[_BulkTask] = []
+        creates = {}
         for locale, attributes in localizations.items():
+            locale = sys.intern(locale)
+            if locale in existing_by_locale:
+                if all(value is None for value in attributes.values()):
+                    # Nothing to send for this locale
+                    tasks.append((locale, 'noop', None))
+                    continue
+                
+                existing = existing_by_locale[locale]
+                if fresh:
+                    # Update existing, sending only the fields that differ
+                    changed = _changed_attributes(
+                        attributes, existing.get('attributes', {}), self._ARG_KEYS
+                    )
+                    if not changed:
+                        tasks.append((locale, 'unchanged', None))
+                        continue
+                else:
+                    # The reused map may predate edits made elsewhere, so
+                    # it only supplies the ID; every given field is sent
+                    changed = {arg: value for arg, value in attributes.items() if value is not None}
+                tasks.append((locale, 'updated', partial(self.update, existing['id'], **changed)))
+            else:
+                # Create new
+                creates[locale] = attributes
+                tasks.append(
+                    (locale, 'created', partial(self.create, app_info_id, locale, **attributes))
+                )
+        
+        created = None
+        batch_error = None
+        if self.use_atomic_operations and len(creates) > 1:
             try:
-                if locale in existing_by_locale:
-                    # Update existing
-                    localization_id = existing_by_locale[locale]['id']
-                    result = self.update(localization_id, **attributes)
-                    results[locale] = {
-                        'success': True,
-                        'action': 'updated',
-                        'data': result
-                    }
+                created = self._create_atomically(app_info_id, creates)
+            except AppStoreConnectError as e:
+                # The batch was attempted and failed; report it for each of its locales
+                batch_error = str(e)
+        batched = created is not None or batch_error is not None
+        if batched:
+            # Already sent in one request; keep the rows without resending
+            tasks = [
+                (locale, action, None if locale in creates else call)
+                for locale, action, call in tasks
+            ]
+        
+        # Each locale is an independent request; run them concurrently
+        results = _run_bulk(tasks, self.max_workers)
+        if batched:
+            for i, locale in enumerate(results.locales):
+                if locale not in creates:
+                    continue
+                if created is None:
+                    results.successes[i] = False
+                    results.data[i] = batch_error
                 else:
-                    # Create new
-                    result = self.create(app_info_id, locale, **attributes)
-                    results[locale] = {
-                        'success': True,
-                        'action': 'created',
-                        'data': result
-                    }
-            except Exception as e:
-                results[locale] = {
-                    'success': False,
-                    'error': str(e)
-                }
+                    results.data[i] = created[locale]
+        
+        # Keep the cached map in step with what was just written
+        for locale, ok, data in zip(results.locales, results.successes, results.data):
+            if ok and data is not None:
+                existing_by_locale[locale] = data
         
         return results
+    
+    def _create_atomically(
+        self,
+        app_info_id: str,
+        creates: Dict[str, Dict[str, Any]]
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Try create_many for bulk_update
+        
+        Args:
+            app_info_id: The app info ID
+            creates: Dict mapping new locale to create() keyword arguments
+            
+        Returns:
+            Dict mapping locale to created data, or None if the server does
+            not support atomic operations and each locale should be created
+            on its own
+            
+        Raises:
+            AppStoreConnectError: The batch was supported but failed
+        """
+        try:
+            records = _call_with_retry(partial(self.create_many, app_info_id, creates))
+        except AppStoreConnectError as e:
+            if e.status_code not in self.ATOMIC_UNSUPPORTED_STATUSES:
+                raise
+            # The endpoint or extension is not available; stop trying it
+            self.use_atomic_operations = False
+            return None
+        
+        return dict(zip(creates, records))
 
 
 class AppStoreVersionLocalizationsAPI(BaseAPI):
@@ -200,18 +520,62 @@ class AppStoreVersionLocalizationsAPI(BaseAPI):
     Manage app store version localizations
     """
     
-    def get_all(self, version_id: str) -> List[Dict[str, Any]]:
+    # JSON:API resource type and the parent relationship used on create
+    _TYPE = 'appStoreVersionLocalizations'
+    _PARENT = ('appStoreVersion', 'appStoreVersions')
+    
+    # API attribute names, in the order of the create/update keyword arguments
+    _ATTRIBUTE_KEYS = (
+        'description',
+        'keywords',
+        'marketingUrl',
+        'promotionalText',
+        'supportUrl',
+        'whatsNew',
+    )
+    _ARG_KEYS = dict(zip(
+        (
+            'description', 'keywords', 'marketing_url',
+            'promotional_text', 'support_url', 'whats_new'
+        ),
+        _ATTRIBUTE_KEYS
+    ))
+    
+    # Concurrent requests used by bulk_update
+    max_workers = 8
+    
+    def get_all(self, version_id: str, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
-        Get all localizations for an app store version
+        Get all localizations for an app store version, following every page
         
         Args:
             version_id: The app store version ID
+            fields: Optional attribute names to limit the response to
             
         Returns:
             List of localization data
         """
-        response = super().get(f'appStoreVersions/{version_id}/appStoreVersionLocalizations')
-        return response.get('data', [])
+        params = {}
+        if fields:
+            params['fields[appStoreVersionLocalizations]'] = ','.join(fields)
+        
+        return self.get_all_pages(
+            f'appStoreVersions/{version_id}/appStoreVersionLocalizations', params=params
+        )
+    
+    def get_all_hydrated(self, version_id: str) -> List[Dict[str, Any]]:
+        """
+        Get all localizations for a version with every editable attribute
+        
+        Use this instead of calling get() per localization.
+        
+        Args:
+            version_id: The app store version ID
+            
+        Returns:
+            List of localization data including locale and all text fields
+        """
+        return self.get_all(version_id, fields=['locale', *self._ATTRIBUTE_KEYS])
     
     def get(self, localization_id: str) -> Dict[str, Any]:
         """
@@ -253,35 +617,19 @@ class AppStoreVersionLocalizationsAPI(BaseAPI):
         Returns:
             Created localization data
         """
-        attributes = {'locale': locale}
-        if description:
-            attributes['description'] = description
-        if keywords:
-            attributes['keywords'] = keywords
-        if marketing_url:
-            attributes['marketingUrl'] = marketing_url
-        if promotional_text:
-            attributes['promotionalText'] = promotional_text
-        if support_url:
-            attributes['supportUrl'] = support_url
-        if whats_new:
-            attributes['whatsNew'] = whats_new
-        
-        data = {
-            'data': {
-                'type': 'appStoreVersionLocalizations',
-                'attributes': attributes,
-                'relationships': {
-                    'appStoreVersion': {
-                        'data': {
-                            'type': 'appStoreVersions',
-                            'id': version_id
-                        }
-                    }
-                }
-            }
+        values = (description, keywords, marketing_url, promotional_text, support_url, whats_new)
+        attributes = {
+            'locale': locale,
+            **{key: value for key, value in zip(self._ATTRIBUTE_KEYS, values) if value}
         }
         
+        relationship, parent_type = self._PARENT
+        data = {'data': {
+            'type': self._TYPE,
+            'attributes': attributes,
+            'relationships': {relationship: {'data': {'type': parent_type, 'id': version_id}}}
+        }}
+        
         response = super().post('appStoreVersionLocalizations', data=data)
         return response['data']
     
@@ -308,30 +656,19 @@ class AppStoreVersionLocalizationsAPI(BaseAPI):
             whats_new: What's new text
             
         Returns:
-            Updated localization data
-        """
-        attributes = {}
-        if description is not None:
-            attributes['description'] = description
-        if keywords is not None:
-            attributes['keywords'] = keywords
-        if marketing_url is not None:
-            attributes['marketingUrl'] = marketing_url
-        if promotional_text is not None:
-            attributes['promotionalText'] = promotional_text
-        if support_url is not None:
-            attributes['supportUrl'] = support_url
-        if whats_new is not None:
-            attributes['whatsNew'] = whats_new
-        
-        data = {
-            'data': {
-                'type': 'appStoreVersionLocalizations',
-                'id': localization_id,
-                'attributes': attributes
-            }
+            Updated localization data, or {} if no attributes were given
+        """
+        values = (description, keywords, marketing_url, promotional_text, support_url, whats_new)
+        attributes = {
+            key: value for key, value in zip(self._ATTRIBUTE_KEYS, values) if value is not None
         }
         
+        if not attributes:
+            # Nothing to change; skip the empty PATCH
+            return {}
+        
+        data = {'data': {'type': self._TYPE, 'id': localization_id, 'attributes': attributes}}
+        
         response = super().patch(f'appStoreVersionLocalizations/{localization_id}', data=data)
         return response['data']
     
@@ -342,4 +679,77 @@ class AppStoreVersionLocalizationsAPI(BaseAPI):
         Args:
             localization_id: The localization ID
         """
-        super().delete(f'appStoreVersionLocalizations/{localization_id}')
\ No newline at end of file
+        super().delete(f'appStoreVersionLocalizations/{localization_id}')
+    
+    def bulk_update(
+        self,
+        version_id: str,
+        localizations: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Bulk update localizations for an app store version
+        
+        Args:
+            version_id: The app store version ID
+            localizations: Dict mapping locale to attributes
+            
+        Returns:
+            Dict mapping locale to result, as {'success': True, 'action': ...,
+            'data': ...} or {'success': False, 'error': ...}
+        """
+        return self.bulk_update_result(version_id, localizations).as_dict()
+    
+    def bulk_update_result(
+        self,
+        version_id: str,
+        localizations: Dict[str, Dict[str, Any]]
+    ) -> BulkResult:
+        """
+        Bulk update like bulk_update, returning the column-wise BulkResult
+        
+        The result is a read-only Mapping with failed() and per-field
+        columns, and it holds fewer objects than the plain dict.
+        
+        Args:
+            version_id: The app store version ID
+            localizations: Dict mapping locale to attributes
+                Example: {
+                    'en-US': {'description': 'My app', 'whats_new': 'Bug fixes'},
+                    'fr-FR': {'description': 'Mon app', 'whats_new': 'Corrections'}
+                }
+                
+        Returns:
+            BulkResult mapping locale to result (success/error)
+        """
+        # Current values are needed to skip fields that already match
+        existing_by_locale = {
+            sys.intern(loc['attributes']['locale']): loc
+            for loc in self.get_all_hydrated(version_id)
+        }
+        
+        tasks: List[_BulkTask] = []
+        for locale, attributes in localizations.items():
+            locale = sys.intern(locale)
+            if locale in existing_by_locale:
+                if all(value is None for value in attributes.values()):
+                    # Nothing to send for this locale
+                    tasks.append((locale, 'noop', None))
+                    continue
+                
+                # Update existing, sending only the fields that differ
+                existing = existing_by_locale[locale]
+                changed = _changed_attributes(
+                    attributes, existing.get('attributes', {}), self._ARG_KEYS
+                )
+                if not changed:
+                    tasks.append((locale, 'unchanged', None))
+                    continue
+                tasks.append((locale, 'updated', partial(self.update, existing['id'], **changed)))
+            else:
+                # Create new
+                tasks.append(
+                    (locale, 'created', partial(self.create, version_id, locale, **attributes))
+                )
+        
+        # Each locale is an independent request; run them concurrently
+        return _run_bulk(tasks, self.max_workers)
@@ -2,18 +2,142 @@
 App Store Versions API module for App Store Connect
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from ..base import BaseAPI
 
 
+# Priority order for the "current" version
+CURRENT_VERSION_STATES = (
+    'READY_FOR_SALE',
+    'PROCESSING_FOR_APP_STORE',
+    'PENDING_DEVELOPER_RELEASE',
+    'IN_REVIEW',
+    'WAITING_FOR_REVIEW',
+    'PREPARE_FOR_SUBMISSION',
+    'DEVELOPER_REJECTED',
+)
+
+
+# JSON:API shape of each write: resource type, attribute keys in argument
+# order, and the (relationship, related type) linked by related_id, if any
+_PAYLOAD_SCHEMAS: Dict[str, Tuple[str, Tuple[str, ...], Optional[Tuple[str, str]]]] = {
+    'create': (
+        'appStoreVersions',
+        ('versionString', 'platform', 'copyright', 'releaseType'),
+        ('app', 'apps')
+    ),
+    'update': (
+        'appStoreVersions',
+        (
+            'versionString', 'copyright', 'releaseType', 'earliestReleaseDate',
+            'usesIdfa', 'isWatchOnly', 'downloadable'
+        ),
+        None
+    ),
+    'submit_for_review': (
+        'appStoreVersionSubmissions',
+        (),
+        ('appStoreVersion', 'appStoreVersions')
+    ),
+    'create_phased_release': (
+        'appStoreVersionPhasedReleases',
+        ('phasedReleaseState',),
+        ('appStoreVersion', 'appStoreVersions')
+    ),
+    'update_phased_release': ('appStoreVersionPhasedReleases', ('phasedReleaseState',), None),
+}
+
+
+def _build_payload(
+    schema: str,
+    values: Tuple[Any, ...] = (),
+    resource_id: Optional[str] = None,
+    related_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build a request body from its entry in _PAYLOAD_SCHEMAS
+    
+    Args:
+        schema: Key into _PAYLOAD_SCHEMAS
+        values: Attribute values in the schema's key order; None values are omitted
+        resource_id: ID of the resource being updated
+        related_id: ID linked through the schema's relationship
+        
+    Returns:
+        JSON:API request body
+    """
+    resource_type, attribute_keys, relationship = _PAYLOAD_SCHEMAS[schema]
+    
+    resource: Dict[str, Any] = {'type': resource_type}
+    if resource_id is not None:
+        resource['id'] = resource_id
+    if attribute_keys:
+        resource['attributes'] = {
+            key: value for key, value in zip(attribute_keys, values) if value is not None
+        }
+    if relationship is not None:
+        name, related_type = relationship
+        resource['relationships'] = {name: {'data': {'type': related_type, 'id': related_id}}}
+    return {'data': resource}
+
+
+class _Paths:
+    """Endpoint paths used by VersionsAPI, as bound str.format templates"""
+    APP_VERSIONS = 'apps/{}/appStoreVersions'.format
+    VERSIONS = 'appStoreVersions'
+    VERSION = 'appStoreVersions/{}'.format
+    BUILD = 'appStoreVersions/{}/build'.format
+    BUILD_RELATIONSHIP = 'appStoreVersions/{}/relationships/build'.format
+    PHASED_RELEASE = 'appStoreVersions/{}/appStoreVersionPhasedRelease'.format
+    SUBMISSIONS = 'appStoreVersionSubmissions'
+    PHASED_RELEASES = 'appStoreVersionPhasedReleases'
+    PHASED_RELEASE_BY_ID = 'appStoreVersionPhasedReleases/{}'.format
+
+
+def _opt_data(response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Get a response's to-one 'data' resource, or None when it is empty or null"""
+    return response.get('data') or None
+
+
+def pick_current_version(versions: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Choose the "current" version from a list by App Store state priority
+    
+    Args:
+        versions: Version data as returned by VersionsAPI.get_all
+        
+    Returns:
+        The current version, the most recent one if no state matches, or None
+    """
+    # One pass: first version seen in each state
+    by_state: Dict[Optional[str], Dict[str, Any]] = {}
+    for version in versions:
+        by_state.setdefault(version['attributes'].get('appStoreState'), version)
+    
+    for state in CURRENT_VERSION_STATES:
+        if state in by_state:
+            return by_state[state]
+    
+    # Return the most recent version if no priority match
+    if versions:
+        return versions[0]
+    
+    return None
+
+
 class VersionsAPI(BaseAPI):
     """
     Manage app store versions in App Store Connect
     """
     
+    # With caching enabled, get_current serves a version list for this long,
+    # then serves it stale for CURRENT_STALE_TTL more while refreshing
+    CURRENT_FRESH_TTL = 60
+    CURRENT_STALE_TTL = 600
+    
     def get_all(self, app_id: str) -> List[Dict[str, Any]]:
         """
-        Get all app store versions for an app
+        Get all app store versions for an app, following every page
         
         Args:
             app_id: The app ID
@@ -21,8 +145,7 @@ class VersionsAPI(BaseAPI):
         Returns:
             List of version data
         """
-        response = super().get(f'apps/{app_id}/appStoreVersions')
-        return response.get('data', [])
+        return self.get_all_pages(_Paths.APP_VERSIONS(app_id))
     
     def get(self, version_id: str) -> Dict[str, Any]:
         """
@@ -34,42 +157,34 @@ class VersionsAPI(BaseAPI):
         Returns:
             Version data
         """
-        response = super().get(f'appStoreVersions/{version_id}')
+        response = super().get(_Paths.VERSION(version_id))
         return response['data']
     
     def get_current(self, app_id: str) -> Optional[Dict[str, Any]]:
         """
         Get the current live version or latest version in review
         
+        With caching enabled the answer may be served stale for up to
+        CURRENT_STALE_TTL seconds while a fresh copy is fetched.
+        
         Args:
             app_id: The app ID
             
         Returns:
             Current version data or None
         """
-        versions = self.get_all(app_id)
-        
-        # Priority order for "current" version
-        priority_states = [
-            'READY_FOR_SALE',
-            'PROCESSING_FOR_APP_STORE',
-            'PENDING_DEVELOPER_RELEASE',
-            'IN_REVIEW',
-            'WAITING_FOR_REVIEW',
-            'PREPARE_FOR_SUBMISSION',
-            'DEVELOPER_REJECTED',
-        ]
-        
-        for state in priority_states:
-            for version in versions:
-                if version['attributes'].get('appStoreState') == state:
-                    return version
-        
-        # Return the most recent version if no priority match
-        if versions:
-            return versions[0]
+        if self.cache is None:
+            return pick_current_version(self.get_all(app_id))
         
-        return None
+        # Keyed apart from get_all's pages, since it holds every version;
+        # a stale list is refreshed in the background
+        response = self.cache.fetch_with_swr(
+            self.cache.make_key(_Paths.APP_VERSIONS(app_id)),
+            lambda: {'data': self.get_all(app_id)},
+            self.CURRENT_FRESH_TTL,
+            self.CURRENT_STALE_TTL
+        )
+        return pick_current_version(response['data'])
     
     def create(
         self,
@@ -92,32 +207,14 @@ class VersionsAPI(BaseAPI):
         Returns:
             Created version data
         """
-        attributes = {
-            'versionString': version_string,
-            'platform': platform
-        }
-        
-        if copyright:
-            attributes['copyright'] = copyright
-        if release_type:
-            attributes['releaseType'] = release_type
-        
-        data = {
-            'data': {
-                'type': 'appStoreVersions',
-                'attributes': attributes,
-                'relationships': {
-                    'app': {
-                        'data': {
-                            'type': 'apps',
-                            'id': app_id
-                        }
-                    }
-                }
-            }
-        }
+        # Empty optional strings are left out rather than sent
+        data = _build_payload(
+            'create',
+            (version_string, platform, copyright or None, release_type or None),
+            related_id=app_id
+        )
         
-        response = super().post('appStoreVersions', data=data)
+        response = super().post(_Paths.VERSIONS, data=data)
         return response['data']
     
     def update(
@@ -147,31 +244,16 @@ class VersionsAPI(BaseAPI):
         Returns:
             Updated version data
         """
-        attributes = {}
-        if version_string is not None:
-            attributes['versionString'] = version_string
-        if copyright is not None:
-            attributes['copyright'] = copyright
-        if release_type is not None:
-            attributes['releaseType'] = release_type
-        if earliest_release_date is not None:
-            attributes['earliestReleaseDate'] = earliest_release_date
-        if uses_idfa is not None:
-            attributes['usesIdfa'] = uses_idfa
-        if is_watch_only is not None:
-            attributes['isWatchOnly'] = is_watch_only
-        if downloadable is not None:
-            attributes['downloadable'] = downloadable
-        
-        data = {
-            'data': {
-                'type': 'appStoreVersions',
-                'id': version_id,
-                'attributes': attributes
-            }
-        }
+        data = _build_payload(
+            'update',
+            (
+                version_string, copyright, release_type, earliest_release_date,
+                uses_idfa, is_watch_only, downloadable
+            ),
+            resource_id=version_id
+        )
         
-        response = super().patch(f'appStoreVersions/{version_id}', data=data)
+        response = super().patch(_Paths.VERSION(version_id), data=data)
         return response['data']
     
     def submit_for_review(self, version_id: str) -> Dict[str, Any]:
@@ -184,21 +266,9 @@ class VersionsAPI(BaseAPI):
         Returns:
             Submission response data
         """
-        data = {
-            'data': {
-                'type': 'appStoreVersionSubmissions',
-                'relationships': {
-                    'appStoreVersion': {
-                        'data': {
-                            'type': 'appStoreVersions',
-                            'id': version_id
-                        }
-                    }
-                }
-            }
-        }
+        data = _build_payload('submit_for_review', related_id=version_id)
         
-        response = super().post('appStoreVersionSubmissions', data=data)
+        response = super().post(_Paths.SUBMISSIONS, data=data)
         return response['data']
     
     def get_build(self, version_id: str) -> Optional[Dict[str, Any]]:
@@ -211,9 +281,8 @@ class VersionsAPI(BaseAPI):
         Returns:
             Build data or None
         """
-        response = super().get(f'appStoreVersions/{version_id}/build')
-        data = response.get('data')
-        return data if data else None
+        response = super().get(_Paths.BUILD(version_id))
+        return _opt_data(response)
     
     def set_build(self, version_id: str, build_id: str) -> Dict[str, Any]:
         """
@@ -234,7 +303,7 @@ class VersionsAPI(BaseAPI):
         }
         
         response = super().patch(
-            f'appStoreVersions/{version_id}/relationships/build',
+            _Paths.BUILD_RELATIONSHIP(version_id),
             data=data
         )
         return response
@@ -249,9 +318,8 @@ class VersionsAPI(BaseAPI):
         Returns:
             Phased release data or None
         """
-        response = super().get(f'appStoreVersions/{version_id}/appStoreVersionPhasedRelease')
-        data = response.get('data')
-        return data if data else None
+        response = super().get(_Paths.PHASED_RELEASE(version_id))
+        return _opt_data(response)
     
     def create_phased_release(
         self,
@@ -268,24 +336,11 @@ class VersionsAPI(BaseAPI):
         Returns:
             Created phased release data
         """
-        data = {
-            'data': {
-                'type': 'appStoreVersionPhasedReleases',
-                'attributes': {
-                    'phasedReleaseState': phased_release_state
-                },
-                'relationships': {
-                    'appStoreVersion': {
-                        'data': {
-                            'type': 'appStoreVersions',
-                            'id': version_id
-                        }
-                    }
-                }
-            }
-        }
+        data = _build_payload(
+            'create_phased_release', (phased_release_state,), related_id=version_id
+        )
         
-        response = super().post('appStoreVersionPhasedReleases', data=data)
+        response = super().post(_Paths.PHASED_RELEASES, data=data)
         return response['data']
     
     def update_phased_release(
@@ -303,15 +358,9 @@ class VersionsAPI(BaseAPI):
         Returns:
             Updated phased release data
         """
-        data = {
-            'data': {
-                'type': 'appStoreVersionPhasedReleases',
-                'id': phased_release_id,
-                'attributes': {
-                    'phasedReleaseState': phased_release_state
-                }
-            }
-        }
+        data = _build_payload(
+            'update_phased_release', (phased_release_state,), resource_id=phased_release_id
+        )
         
-        response = super().patch(f'appStoreVersionPhasedReleases/{phased_release_id}', data=data)
+        response = super().patch(_Paths.PHASED_RELEASE_BY_ID(phased_release_id), data=data)
         return response['data']
\ No newline at end of file
@@ -0,0 +1,502 @@
+"""
+Asynchronous client for App Store Connect API
+
+Independent requests run concurrently over one pooled session. App Store
+Connect speaks HTTP/2, so with httpx and h2 installed
+(``pip install "app-store-connect-wrapper[http2]"``) concurrent requests are
+multiplexed over a single connection; otherwise aiohttp is used
+(``pip install "app-store-connect-wrapper[async]"``).
+"""
+
+import asyncio
+import importlib
+import json
+import sys
+from types import ModuleType
+from typing import Optional, Dict, Any, List, Tuple, Type
+from urllib.parse import urljoin, urlparse
+
+from .auth import Auth
+from .base import BaseAPI, _StatusErrors
+from .exceptions import AppStoreConnectError
+from .rate_limiter import RateLimiter
+from .api.versions import _Paths, _opt_data, pick_current_version
+from .client import VersionBundle
+
+
+def _import_optional(name: str) -> Optional[ModuleType]:
+    """Import an optional transport package, or None if it is not installed"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _transport_errors() -> Tuple[Type[BaseException], ...]:
+    """
+    Transport errors reported as AppStoreConnectError
+    
+    A session's package is imported before the session exists, so looking
+    in sys.modules finds it without importing any transport here.
+    """
+    aiohttp = sys.modules.get('aiohttp')
+    httpx = sys.modules.get('httpx')
+    return (
+        (asyncio.TimeoutError,)
+        + ((aiohttp.ClientError,) if aiohttp else ())
+        + ((httpx.HTTPError,) if httpx else ())
+    )
+
+
+class _BufferedResponse:
+    """Fully read response exposing the attributes BaseAPI's error handling uses"""
+    
+    # One is built per request
+    __slots__ = ('status_code', 'headers', 'text')
+    
+    def __init__(self, status_code: int, headers: Dict[str, str], text: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+    
+    def json(self) -> Dict[str, Any]:
+        return json.loads(self.text)
+
+
+class AsyncBaseAPI(_StatusErrors):
+    """
+    Base class for async API modules
+    
+    Every module of an AsyncClient shares its session and concurrency limit,
+    and every client shares the synchronous client's per-host rate limiter.
+    Error statuses raise the same exceptions as the synchronous client.
+    """
+    
+    BASE_URL = BaseAPI.BASE_URL
+    
+    def __init__(self, auth: Auth, session: Any, semaphore: asyncio.Semaphore):
+        """
+        Initialize async base API
+        
+        Args:
+            auth: Authentication instance
+            session: Shared httpx.AsyncClient or aiohttp.ClientSession
+            semaphore: Limits requests in flight across the client
+        """
+        self.auth = auth
+        self.session = session
+        self._semaphore = semaphore
+        self.rate_limiter = RateLimiter.shared(urlparse(self.BASE_URL).netloc)
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Make an API request
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            data: Request body data
+            params: Query parameters
+            
+        Returns:
+            JSON response data
+            
+        Raises:
+            Various AppStoreConnectError subclasses
+        """
+        url = urljoin(self.BASE_URL, endpoint)
+        
+        async with self._semaphore:
+            # acquire() blocks while pacing, so wait for it off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self.rate_limiter.acquire)
+            try:
+                response = await self._send(method, url, data, params)
+            except _transport_errors() as e:
+                raise AppStoreConnectError(f"Request failed: {e}")
+        
+        if response.status_code in (200, 201):
+            return response.json()
+        elif response.status_code == 204:
+            return {}
+        
+        raise self._error_for_status(response, endpoint)
+    
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict],
+        params: Optional[Dict]
+    ) -> _BufferedResponse:
+        """Send one request over the session and read the whole body"""
+        httpx = sys.modules.get('httpx')
+        if httpx is not None and isinstance(self.session, httpx.AsyncClient):
+            raw = await self.session.request(
+                method, url, json=data, params=params, headers=self.auth.headers
+            )
+            return _BufferedResponse(raw.status_code, raw.headers, raw.text)
+        
+        async with self.session.request(
+            method,
+            url,
+            json=data,
+            params=params,
+            headers=self.auth.headers
+        ) as raw:
+            return _BufferedResponse(raw.status, raw.headers, await raw.text())
+    
+    async def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make a GET request"""
+        return await self._request('GET', endpoint, params=params)
+    
+    async def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Make a POST request"""
+        return await self._request('POST', endpoint, data=data)
+    
+    async def patch(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Make a PATCH request"""
+        return await self._request('PATCH', endpoint, data=data)
+    
+    async def delete(self, endpoint: str) -> Dict[str, Any]:
+        """Make a DELETE request"""
+        return await self._request('DELETE', endpoint)
+    
+    async def _list(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """GET an endpoint and return its 'data' list (empty if missing)"""
+        return (await self._request('GET', endpoint, params=params)).get('data') or []
+    
+    async def _item(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """GET an endpoint and return its 'data' resource"""
+        return (await self._request('GET', endpoint, params=params))['data']
+    
+    async def get_all_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        limit: int = 200
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all pages of results from a paginated endpoint
+        
+        Pages are chained by cursor, so they are fetched one after another.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            limit: Number of results per page (max 200)
+            
+        Returns:
+            List of all results
+        """
+        params = {**(params or {}), 'limit': min(limit, 200)}
+        all_results = []
+        
+        while True:
+            response = await self._request('GET', endpoint, params=params)
+            all_results.extend(response.get('data', []))
+            
+            next_url = response.get('links', {}).get('next')
+            if not next_url:
+                return all_results
+            
+            # Next URL already carries the query params
+            endpoint = next_url.replace(self.BASE_URL, '')
+            params = None
+
+
+class AsyncAppsAPI(AsyncBaseAPI):
+    """
+    Read apps and their related records concurrently
+    """
+    
+    async def get_app(self, app_id: str) -> Dict[str, Any]:
+        """
+        Get app details by ID
+        
+        Args:
+            app_id: The app ID
+            
+        Returns:
+            App data
+        """
+        return await self._item(f'apps/{app_id}')
+    
+    async def get_by_bundle_id(self, bundle_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get app by bundle ID
+        
+        Args:
+            bundle_id: The app's bundle identifier
+            
+        Returns:
+            App data or None if not found
+        """
+        data = await self._list('apps', params={'filter[bundleId]': bundle_id})
+        return data[0] if data else None
+    
+    async def get_app_infos(self, app_id: str) -> List[Dict[str, Any]]:
+        """
+        Get app info records for an app
+        
+        Args:
+            app_id: The app ID
+            
+        Returns:
+            List of app info data
+        """
+        return await self._list(f'apps/{app_id}/appInfos')
+    
+    async def get_app_store_versions(self, app_id: str) -> List[Dict[str, Any]]:
+        """
+        Get app store versions for an app
+        
+        Args:
+            app_id: The app ID
+            
+        Returns:
+            List of version data
+        """
+        return await self._list(_Paths.APP_VERSIONS(app_id))
+
+
+class AsyncVersionsAPI(AsyncBaseAPI):
+    """
+    Read app store versions and their build and phased release concurrently
+    """
+    
+    async def get_all(self, app_id: str) -> List[Dict[str, Any]]:
+        """
+        Get all app store versions for an app, following every page
+        
+        Args:
+            app_id: The app ID
+            
+        Returns:
+            List of version data
+        """
+        return await self.get_all_pages(_Paths.APP_VERSIONS(app_id))
+    
+    async def get_version(self, version_id: str) -> Dict[str, Any]:
+        """
+        Get a specific app store version
+        
+        Args:
+            version_id: The version ID
+            
+        Returns:
+            Version data
+        """
+        return await self._item(_Paths.VERSION(version_id))
+    
+    async def get_current(self, app_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the current live version or latest version in review
+        
+        Args:
+            app_id: The app ID
+            
+        Returns:
+            Current version data or None
+        """
+        return pick_current_version(await self.get_all(app_id))
+    
+    async def get_build(self, version_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the build associated with a version
+        
+        Args:
+            version_id: The version ID
+            
+        Returns:
+            Build data or None
+        """
+        response = await self.get(_Paths.BUILD(version_id))
+        return _opt_data(response)
+    
+    async def get_phased_release(self, version_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get phased release information for a version
+        
+        Args:
+            version_id: The version ID
+            
+        Returns:
+            Phased release data or None
+        """
+        response = await self.get(_Paths.PHASED_RELEASE(version_id))
+        return _opt_data(response)
+
+
+class AsyncVersionLocalizationsAPI(AsyncBaseAPI):
+    """
+    Read app store version localizations
+    """
+    
+    async def get_all(self, version_id: str) -> List[Dict[str, Any]]:
+        """
+        Get all localizations for an app store version, following every page
+        
+        Args:
+            version_id: The app store version ID
+            
+        Returns:
+            List of localization data
+        """
+        return await self.get_all_pages(
+            f'appStoreVersions/{version_id}/appStoreVersionLocalizations'
+        )
+
+
+class AsyncClient:
+    """
+    Async client for App Store Connect API
+    
+    API modules are available inside ``async with``, which opens one pooled
+    session for every request and closes it on exit. The session is an
+    HTTP/2 httpx client when httpx and h2 are installed, else aiohttp.
+    
+    Example:
+        >>> from app_store_connect import AsyncClient
+        >>> async with AsyncClient(
+        ...     key_id='YOUR_KEY_ID',
+        ...     issuer_id='YOUR_ISSUER_ID',
+        ...     private_key_path='/path/to/AuthKey_YOUR_KEY_ID.p8'
+        ... ) as client:
+        ...     versions = await asyncio.gather(*(client.get_current_version(a) for a in app_ids))
+    """
+    
+    # Requests in flight at once across all API modules
+    MAX_CONCURRENCY = 64
+    
+    # Connection pool sizing; HTTP/2 multiplexes streams, so needs far fewer
+    CONNECTION_LIMIT = 64
+    CONNECTION_LIMIT_PER_HOST = 20
+    HTTP2_CONNECTION_LIMIT = 20
+    KEEPALIVE_TIMEOUT = 75
+    REQUEST_TIMEOUT = 30.0
+    
+    def __init__(
+        self,
+        key_id: str,
+        issuer_id: str,
+        private_key_path: str,
+        auth: Optional[Auth] = None,
+        session: Optional[Any] = None
+    ):
+        """
+        Initialize the async App Store Connect client
+        
+        Args:
+            key_id: Your App Store Connect API Key ID
+            issuer_id: Your App Store Connect Issuer ID
+            private_key_path: Path to your .p8 private key file
+            auth: Optional Auth instance (if not provided, one will be created)
+            session: Optional httpx.AsyncClient or aiohttp.ClientSession to use
+                instead of opening one; the caller keeps ownership and must close it
+        """
+        if auth:
+            self._auth = auth
+        else:
+            self._auth = Auth(key_id, issuer_id, private_key_path)
+        
+        self._session = session
+        self._owns_session = session is None
+        
+        # API modules, built by __aenter__ once the event loop is running
+        self.apps: AsyncAppsAPI
+        self.versions: AsyncVersionsAPI
+        self.version_localizations: AsyncVersionLocalizationsAPI
+    
+    async def __aenter__(self) -> 'AsyncClient':
+        if self._session is None:
+            self._session = self._open_session()
+        
+        # Created here so it belongs to the running event loop
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        self.apps = AsyncAppsAPI(self._auth, self._session, semaphore)
+        self.versions = AsyncVersionsAPI(self._auth, self._session, semaphore)
+        self.version_localizations = AsyncVersionLocalizationsAPI(
+            self._auth, self._session, semaphore
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._owns_session and self._session is not None:
+            # httpx closes with aclose(), aiohttp with close()
+            close = getattr(self._session, 'aclose', None) or self._session.close
+            await close()
+            self._session = None
+    
+    def _open_session(self) -> Any:
+        """Open an HTTP/2 httpx client if possible, else an aiohttp session"""
+        httpx = _import_optional('httpx')
+        if httpx is not None and _import_optional('h2') is not None:
+            return httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.HTTP2_CONNECTION_LIMIT,
+                    max_keepalive_connections=self.HTTP2_CONNECTION_LIMIT,
+                    keepalive_expiry=self.KEEPALIVE_TIMEOUT
+                ),
+                timeout=httpx.Timeout(self.REQUEST_TIMEOUT)
+            )
+        
+        aiohttp = _import_optional('aiohttp')
+        if aiohttp is None:
+            raise ImportError(
+                'AsyncClient requires httpx with HTTP/2 or aiohttp: '
+                'pip install "app-store-connect-wrapper[http2]" '
+                'or "app-store-connect-wrapper[async]"'
+            )
+        connector = aiohttp.TCPConnector(
+            limit=self.CONNECTION_LIMIT,
+            limit_per_host=self.CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=self.KEEPALIVE_TIMEOUT
+        )
+        return aiohttp.ClientSession(connector=connector)
+    
+    async def get_current_version(self, app_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the current version of an app
+        
+        Args:
+            app_id: The app ID
+            
+        Returns:
+            Current version data or None
+        """
+        return await self.versions.get_current(app_id)
+    
+    async def get_version_bundle(self, app_id: str) -> Optional[VersionBundle]:
+        """
+        Get the current version with its build, phased release, localizations and app
+        
+        The app is fetched alongside the version list, then the three
+        version records are fetched concurrently.
+        
+        Args:
+            app_id: The app ID
+            
+        Returns:
+            VersionBundle, or None if the app has no versions
+        """
+        app, version = await asyncio.gather(
+            self.apps.get_app(app_id),
+            self.versions.get_current(app_id)
+        )
+        if version is None:
+            return None
+        
+        version_id = version['id']
+        build, phased_release, localizations = await asyncio.gather(
+            self.versions.get_build(version_id),
+            self.versions.get_phased_release(version_id),
+            self.version_localizations.get_all(version_id)
+        )
+        return VersionBundle(version, build, phased_release, localizations, app)
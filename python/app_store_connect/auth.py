@@ -2,15 +2,54 @@
 Authentication module for App Store Connect API
 """
 
+import hashlib
+import json
 import jwt
+import os
+import tempfile
+from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePrivateKey
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Tuple, cast
 from datetime import datetime, timedelta
 
 from .exceptions import AuthenticationError
 
 
+# Signed tokens shared by every Auth instance in the process,
+# keyed by (key_id, issuer_id, private key PEM) -> (token, expiry)
+_token_cache: Dict[Tuple[str, str, str], Tuple[str, int]] = {}
+
+
+def _cache_disabled() -> bool:
+    """Check whether process-level key/token caching is switched off"""
+    return os.getenv('ASC_AUTH_DISABLE_CACHE', '').lower() in ('1', 'true', 'yes')
+
+
+def _token_cache_dir() -> Optional[Path]:
+    """Directory for tokens persisted across processes, from ASC_TOKEN_CACHE_DIR"""
+    value = os.getenv('ASC_TOKEN_CACHE_DIR')
+    if not value or _cache_disabled():
+        return None
+    return Path(value).expanduser()
+
+
+@lru_cache(maxsize=8)
+def _read_private_key(path: str, mtime: float) -> str:
+    """Read a private key file; cached per (path, mtime) so edits are picked up"""
+    with open(path, 'r') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=8)
+def _parse_private_key(pem: str) -> EllipticCurvePrivateKey:
+    """Parse a PEM private key once so token signing skips the ASN.1 decode"""
+    # App Store Connect issues P-256 keys only
+    return cast(EllipticCurvePrivateKey, load_pem_private_key(pem.encode(), password=None))
+
+
 class Auth:
     """
     Handles JWT authentication for App Store Connect API
@@ -28,8 +67,16 @@ class Auth:
         self.key_id = key_id
         self.issuer_id = issuer_id
         self.private_key_path = Path(private_key_path)
-        self._token = None
-        self._token_expiry = 0
+        self._token: Optional[str] = None
+        self._token_expiry: float = 0
+        
+        # Claims and JWT header fields that never change for these credentials
+        self._static_payload = {'iss': issuer_id, 'aud': 'appstoreconnect-v1'}
+        self._static_headers = {'kid': key_id, 'alg': 'ES256', 'typ': 'JWT'}
+        
+        # Request headers built for the token in _headers_token
+        self._headers_token: Optional[str] = None
+        self._headers_cache: Dict[str, str] = {}
         
         if not self.private_key_path.exists():
             raise AuthenticationError(f"Private key file not found: {private_key_path}")
@@ -37,10 +84,22 @@ class Auth:
         self._load_private_key()
     
     def _load_private_key(self):
-        """Load the private key from file"""
+        """Load and parse the private key from file"""
         try:
-            with open(self.private_key_path, 'r') as f:
-                self.private_key = f.read()
+            try:
+                mtime = self.private_key_path.stat().st_mtime
+            except OSError:
+                mtime = None
+            
+            if mtime is None or _cache_disabled():
+                with open(self.private_key_path, 'r') as f:
+                    self._private_key_pem = f.read()
+                self.private_key = load_pem_private_key(
+                    self._private_key_pem.encode(), password=None
+                )
+            else:
+                self._private_key_pem = _read_private_key(str(self.private_key_path), mtime)
+                self.private_key = _parse_private_key(self._private_key_pem)
         except Exception as e:
             raise AuthenticationError(f"Failed to load private key: {e}")
     
@@ -55,51 +114,129 @@ class Auth:
         if self._token and time.time() < (self._token_expiry - 60):
             return self._token
         
+        # Reuse a token another instance signed with the same credentials
+        if not _cache_disabled():
+            cached = _token_cache.get(self._cache_key)
+            if cached and time.time() < (cached[1] - 60):
+                self._token, self._token_expiry = cached
+                return self._token
+            
+            # Reuse a token an earlier process signed with the same credentials
+            if self._load_disk_token():
+                return self._token
+        
         # Generate new token
         self._generate_token()
         return self._token
     
     def _generate_token(self):
         """Generate a new JWT token"""
+        now = int(time.time())
         # Token expires in 20 minutes (maximum allowed by Apple)
-        expiry_time = int(time.time()) + (20 * 60)
+        expiry_time = now + (20 * 60)
         
-        payload = {
-            'iss': self.issuer_id,
-            'iat': int(time.time()),
-            'exp': expiry_time,
-            'aud': 'appstoreconnect-v1'
-        }
-        
-        headers = {
-            'kid': self.key_id,
-            'alg': 'ES256',
-            'typ': 'JWT'
-        }
+        payload = {**self._static_payload, 'iat': now, 'exp': expiry_time}
         
         try:
             self._token = jwt.encode(
                 payload,
                 self.private_key,
                 algorithm='ES256',
-                headers=headers
+                headers=self._static_headers
             )
             self._token_expiry = expiry_time
         except Exception as e:
             raise AuthenticationError(f"Failed to generate JWT token: {e}")
+        
+        if not _cache_disabled():
+            _token_cache[self._cache_key] = (self._token, self._token_expiry)
+            self._store_disk_token()
+    
+    def _disk_token_path(self) -> Optional[Path]:
+        """File holding this key's persisted token, or None if persistence is off"""
+        cache_dir = _token_cache_dir()
+        return cache_dir / f'{self.key_id}.json' if cache_dir else None
+    
+    def _key_fingerprint(self) -> str:
+        """Hash identifying the issuer and private key a persisted token was signed for"""
+        return hashlib.sha256(f'{self.issuer_id}\n{self._private_key_pem}'.encode()).hexdigest()
+    
+    def _load_disk_token(self) -> bool:
+        """
+        Adopt a still-valid token from ASC_TOKEN_CACHE_DIR
+        
+        Returns:
+            True if a token was loaded
+        """
+        path = self._disk_token_path()
+        if path is None:
+            return False
+        
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+            token, expiry = entry['token'], int(entry['expiry'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        
+        if entry.get('fingerprint') != self._key_fingerprint() or time.time() >= expiry - 60:
+            return False
+        
+        self._token, self._token_expiry = token, expiry
+        _token_cache[self._cache_key] = (token, expiry)
+        return True
+    
+    def _store_disk_token(self):
+        """Persist the current token to ASC_TOKEN_CACHE_DIR, readable only by the owner"""
+        path = self._disk_token_path()
+        if path is None:
+            return
+        
+        entry = {
+            'key_id': self.key_id,
+            'fingerprint': self._key_fingerprint(),
+            'token': self._token,
+            'expiry': self._token_expiry
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            # mkstemp creates the file with mode 0600; the rename is atomic
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # Persistence is best effort; the in-memory token is still valid
+            pass
+    
+    @property
+    def _cache_key(self) -> Tuple[str, str, str]:
+        """Key identifying these credentials in the shared token cache"""
+        return (self.key_id, self.issuer_id, self._private_key_pem)
     
     @property
     def headers(self) -> dict:
         """
         Get authorization headers for API requests
         
+        The same dict is returned until the token changes, so callers
+        must not mutate it.
+        
         Returns:
             Dictionary with Authorization header
         """
-        return {
-            'Authorization': f'Bearer {self.get_token()}',
-            'Content-Type': 'application/json'
-        }
+        token = self.get_token()
+        if token is not self._headers_token:
+            self._headers_cache = {
+                'Authorization': f'Bearer {token}',
+                'Content-Type': 'application/json'
+            }
+            self._headers_token = token
+        return self._headers_cache
     
     def is_token_valid(self) -> bool:
         """Check if current token is still valid"""
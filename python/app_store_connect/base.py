@@ -2,11 +2,23 @@
 Base API client for App Store Connect
 """
 
+import json
 import requests
-from typing import Dict, Any, Optional, List
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Optional, List, Tuple, Mapping, Protocol
+from types import ModuleType
+from urllib.parse import urljoin, urlparse
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .auth import Auth
+from .cache import TTLCache
+from .rate_limiter import RateLimiter
 from .exceptions import (
     AppStoreConnectError,
     RateLimitError,
@@ -16,30 +28,159 @@ from .exceptions import (
 )
 
 
-class BaseAPI:
+# Parses response bytes directly; orjson also skips the separate UTF-8 decode
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+class _ErrorResponse(Protocol):
+    """The parts of a response that error handling reads"""
+    
+    @property
+    def status_code(self) -> int: ...
+    
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+    
+    @property
+    def text(self) -> str: ...
+    
+    def json(self) -> Any: ...
+
+
+class _StatusErrors:
+    """
+    Map unsuccessful responses to exceptions
+    
+    Shared by BaseAPI and the async client's AsyncBaseAPI.
+    """
+    
+    rate_limiter: RateLimiter
+    
+    def _error_for_status(self, response: _ErrorResponse, endpoint: str) -> AppStoreConnectError:
+        """
+        Build the exception matching an unsuccessful response
+        
+        Args:
+            response: Response with a non-success status code
+            endpoint: API endpoint, used in the not-found message
+            
+        Returns:
+            AppStoreConnectError subclass for the caller to raise, with
+            status_code set
+        """
+        error: AppStoreConnectError
+        if response.status_code == 401:
+            error = AppStoreConnectError("Authentication failed. Check your credentials.")
+        elif response.status_code == 403:
+            error = AppStoreConnectError("Forbidden. Check your permissions.")
+        elif response.status_code == 404:
+            error = NotFoundError(f"Resource not found: {endpoint}")
+        elif response.status_code == 409:
+            error_msg = self._extract_error_message(response)
+            error = ConflictError(error_msg or "Conflict occurred")
+        elif response.status_code == 422:
+            error_msg = self._extract_error_message(response)
+            error = ValidationError(error_msg or "Validation failed")
+        elif response.status_code == 429:
+            retry_after = self._parse_retry_after(response)
+            if retry_after:
+                # Hold every caller sharing the limiter, not just this one
+                self.rate_limiter.pause(retry_after)
+            error = RateLimitError(
+                "API rate limit exceeded. Please wait before retrying.",
+                retry_after=retry_after
+            )
+        else:
+            error_msg = self._extract_error_message(response)
+            error = AppStoreConnectError(
+                f"API request failed with status {response.status_code}: {error_msg}"
+            )
+        
+        # Lets callers branch on statuses that share an exception type
+        error.status_code = response.status_code
+        return error
+    
+    def _parse_retry_after(self, response: _ErrorResponse) -> Optional[float]:
+        """Extract the Retry-After delay in seconds, if the server sent one"""
+        try:
+            return float(response.headers['Retry-After'])
+        except (KeyError, TypeError, ValueError):
+            return None
+    
+    def _extract_error_message(self, response: _ErrorResponse) -> Optional[str]:
+        """Extract error message from response"""
+        try:
+            data = response.json()
+            if 'errors' in data and len(data['errors']) > 0:
+                return data['errors'][0].get('title') or data['errors'][0].get('detail')
+        except:
+            return response.text
+        return None
+
+
+class BaseAPI(_StatusErrors):
     """
     Base class for all API modules
     """
     
     BASE_URL = "https://api.appstoreconnect.apple.com/v1/"
     
-    def __init__(self, auth: Auth):
+    # Keep-alive connections pooled for the API host; at least as large as
+    # the bulk_update worker count so concurrent writes reuse connections
+    POOL_MAXSIZE = 20
+    POOL_CONNECTIONS = 10
+    
+    def __init__(self, auth: Auth, session: Optional[requests.Session] = None):
         """
         Initialize base API
         
         Args:
             auth: Authentication instance
+            session: Shared session from new_session() (default: a new one)
         """
         self.auth = auth
-        self.session = requests.Session()
+        self.session = session if session is not None else self.new_session()
         self.session.headers.update(self.auth.headers)
+        # Paces every request; shared by all modules talking to this host
+        self.rate_limiter = RateLimiter.shared(urlparse(self.BASE_URL).netloc)
+        # (endpoint, params) -> (etag, parsed body) for conditional GETs
+        self._etag_cache: Dict[Tuple, Tuple[str, Dict[str, Any]]] = {}
+        # Response cache for GETs; set by Client(enable_caching=True)
+        self.cache: Optional[TTLCache] = None
+    
+    @classmethod
+    def new_session(cls) -> requests.Session:
+        """
+        Create a session with a keep-alive connection pool
+        
+        Idempotent GETs are retried on connection errors and gateway
+        failures; other requests are left to the caller.
+        
+        Returns:
+            Configured requests.Session
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({'GET'}),
+            raise_on_status=False
+        )
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(
+            pool_connections=cls.POOL_CONNECTIONS,
+            pool_maxsize=cls.POOL_MAXSIZE,
+            max_retries=retry
+        ))
+        return session
     
     def _request(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict] = None,
-        params: Optional[Dict] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        etag_key: Optional[Tuple] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -50,6 +191,8 @@ class BaseAPI:
             endpoint: API endpoint
             data: Request body data
             params: Query parameters
+            etag_key: If set, send If-None-Match for the body cached under this
+                key and return that body on 304 Not Modified
             **kwargs: Additional request arguments
             
         Returns:
@@ -63,6 +206,17 @@ class BaseAPI:
         # Refresh auth headers
         self.session.headers.update(self.auth.headers)
         
+        cached = self._etag_cache.get(etag_key) if etag_key is not None else None
+        if cached:
+            kwargs['headers'] = {**kwargs.get('headers', {}), 'If-None-Match': cached[0]}
+        
+        if data is not None and orjson is not None:
+            # Pre-encode the body so requests skips its stdlib json.dumps
+            kwargs['data'] = orjson.dumps(data)
+            data = None
+        
+        self.rate_limiter.acquire()
+        
         try:
             response = self.session.request(
                 method=method,
@@ -76,66 +230,110 @@ class BaseAPI:
         
         # Handle different status codes
         if response.status_code == 200:
-            return response.json()
+            body = _loads(response.content)
+            if etag_key is not None:
+                etag = response.headers.get('ETag')
+                if etag:
+                    self._etag_cache[etag_key] = (etag, body)
+            return body
+        elif response.status_code == 304 and cached:
+            return cached[1]
         elif response.status_code == 201:
-            return response.json()
+            return _loads(response.content)
         elif response.status_code == 204:
             return {}
-        elif response.status_code == 401:
-            raise AppStoreConnectError("Authentication failed. Check your credentials.")
-        elif response.status_code == 403:
-            raise AppStoreConnectError("Forbidden. Check your permissions.")
-        elif response.status_code == 404:
-            raise NotFoundError(f"Resource not found: {endpoint}")
-        elif response.status_code == 409:
-            error_msg = self._extract_error_message(response)
-            raise ConflictError(error_msg or "Conflict occurred")
-        elif response.status_code == 422:
-            error_msg = self._extract_error_message(response)
-            raise ValidationError(error_msg or "Validation failed")
-        elif response.status_code == 429:
-            raise RateLimitError("API rate limit exceeded. Please wait before retrying.")
-        else:
-            error_msg = self._extract_error_message(response)
-            raise AppStoreConnectError(
-                f"API request failed with status {response.status_code}: {error_msg}"
-            )
-    
-    def _extract_error_message(self, response: requests.Response) -> Optional[str]:
-        """Extract error message from response"""
-        try:
-            data = response.json()
-            if 'errors' in data and len(data['errors']) > 0:
-                return data['errors'][0].get('title') or data['errors'][0].get('detail')
-        except:
-            return response.text
-        return None
+        
+        raise self._error_for_status(response, endpoint)
     
-    def get(self, endpoint: str, params: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
-        """Make a GET request"""
-        return self._request('GET', endpoint, params=params, **kwargs)
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Mapping[str, Any]] = None,
+        use_etag: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make a GET request
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            use_etag: Revalidate with the ETag from the last response for this
+                endpoint and params, reusing its body when the server replies 304
+            **kwargs: Additional request arguments
+            
+        Returns:
+            JSON response data
+        """
+        if use_etag:
+            etag_key = (endpoint, tuple(sorted((params or {}).items())))
+            return self._request('GET', endpoint, params=params, etag_key=etag_key, **kwargs)
+        if self.cache is None:
+            return self._request('GET', endpoint, params=params, **kwargs)
+        
+        cache_key = self.cache.make_key(endpoint, params)
+        response = self.cache.get(cache_key)
+        if response is None:
+            response = self._request('GET', endpoint, params=params, **kwargs)
+            self.cache.set(cache_key, response, self.cache.ttl_for(endpoint))
+        return response
     
     def post(self, endpoint: str, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
         """Make a POST request"""
-        return self._request('POST', endpoint, data=data, **kwargs)
+        return self._write('POST', endpoint, data=data, **kwargs)
     
     def patch(self, endpoint: str, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
         """Make a PATCH request"""
-        return self._request('PATCH', endpoint, data=data, **kwargs)
+        return self._write('PATCH', endpoint, data=data, **kwargs)
     
     def delete(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make a DELETE request"""
-        return self._request('DELETE', endpoint, **kwargs)
+        return self._write('DELETE', endpoint, **kwargs)
+    
+    def _write(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Send a write, evicting cached GETs it affects before and after"""
+        self._invalidate_cached(endpoint)
+        response = self._request(method, endpoint, **kwargs)
+        # A GET that ran during the write may have cached the old state
+        self._invalidate_cached(endpoint)
+        return response
+    
+    def _invalidate_cached(self, endpoint: str):
+        """
+        Evict cached GETs of every resource type an endpoint touches
+        
+        Each path segment is evicted, so a write to
+        ``appStoreVersions/{id}/relationships/builds`` drops cached versions
+        and builds alike, including lists such as ``apps/{app_id}/appStoreVersions``.
+        """
+        if self.cache is not None:
+            for segment in set(endpoint.split('?', 1)[0].split('/')):
+                self.cache.invalidate(segment)
+    
+    def _list(
+        self, endpoint: str, params: Optional[Mapping[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """GET an endpoint and return its 'data' list (empty if missing)"""
+        # Subclasses redefine get() for single records
+        return BaseAPI.get(self, endpoint, params=params).get('data') or []
+    
+    def _item(self, endpoint: str, params: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        """GET an endpoint and return its 'data' resource"""
+        return BaseAPI.get(self, endpoint, params=params)['data']
     
     def get_all_pages(
         self,
         endpoint: str,
-        params: Optional[Dict] = None,
+        params: Optional[Mapping[str, Any]] = None,
         limit: int = 200
     ) -> List[Dict[str, Any]]:
         """
         Get all pages of results from a paginated endpoint
         
+        App Store Connect paginates with opaque cursors, so each page's URL
+        is only known once the previous page arrives; pages are fetched at
+        the maximum size to keep the walk as short as possible.
+        
         Args:
             endpoint: API endpoint
             params: Query parameters
@@ -144,14 +342,12 @@ class BaseAPI:
         Returns:
             List of all results
         """
-        if params is None:
-            params = {}
-        
-        params['limit'] = min(limit, 200)
+        params = {**(params or {}), 'limit': min(limit, 200)}
         all_results = []
         
         while True:
-            response = self.get(endpoint, params=params)
+            # Subclasses redefine get() for single records
+            response = BaseAPI.get(self, endpoint, params=params)
             data = response.get('data', [])
             all_results.extend(data)
             
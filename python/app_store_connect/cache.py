@@ -0,0 +1,163 @@
+"""
+In-memory response cache for idempotent App Store Connect GET requests
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+
+# Seconds a GET response is reused, by the resource type it returns. The
+# first type found in the path wins, so nested lists take their own TTL.
+PATH_TTLS: Tuple[Tuple[str, float], ...] = (
+    ('appStoreVersions', 60),
+    ('apps', 300),
+)
+DEFAULT_TTL = 30
+
+
+class TTLCache:
+    """
+    Thread-safe map of request key to parsed response with per-entry expiry
+    
+    Cached responses are shared, so callers must not mutate them.
+    """
+    
+    def __init__(self):
+        # key -> (fresh_until, stale_until, payload)
+        self._entries: Dict[str, Tuple[float, float, Any]] = {}
+        # Keys with a background refresh in flight
+        self._refreshing = set()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(path: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        Build the cache key for a request
+        
+        Args:
+            path: API endpoint relative to BASE_URL
+            params: Query parameters
+            
+        Returns:
+            Path and sorted, encoded query string
+        """
+        return f"{path}?{urlencode(sorted((params or {}).items()))}"
+    
+    @staticmethod
+    def ttl_for(path: str) -> float:
+        """Get the TTL for a path from PATH_TTLS, falling back to DEFAULT_TTL"""
+        segments = path.split('?', 1)[0].split('/')
+        for resource_type, ttl in PATH_TTLS:
+            if resource_type in segments:
+                return ttl
+        return DEFAULT_TTL
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached payload, or None if missing or no longer fresh"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if now >= entry[1]:
+                del self._entries[key]
+            if now >= entry[0]:
+                return None
+            return entry[2]
+    
+    def set(self, key: str, payload: Any, ttl: float, stale_ttl: float = 0):
+        """
+        Store a payload
+        
+        Args:
+            key: Cache key
+            payload: Parsed response to store
+            ttl: Seconds the payload is fresh
+            stale_ttl: Further seconds fetch_with_swr may serve it while refreshing
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now + ttl, now + ttl + stale_ttl, payload)
+    
+    def fetch_with_swr(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: float,
+        stale_ttl: float
+    ) -> Any:
+        """
+        Get a payload with stale-while-revalidate semantics
+        
+        A fresh entry is returned as is. A stale entry is returned at once
+        while a background thread reloads it. A missing entry is loaded
+        before returning.
+        
+        Args:
+            key: Cache key
+            loader: Fetches the payload
+            ttl: Seconds a loaded payload is fresh
+            stale_ttl: Further seconds a stale payload may be served
+            
+        Returns:
+            The cached or freshly loaded payload
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now < entry[0]:
+                return entry[2]
+            stale = entry is not None and now < entry[1]
+            start_refresh = stale and key not in self._refreshing
+            if start_refresh:
+                self._refreshing.add(key)
+        
+        if entry is None or not stale:
+            payload = loader()
+            self.set(key, payload, ttl, stale_ttl)
+            return payload
+        
+        if start_refresh:
+            threading.Thread(
+                target=self._refresh, args=(key, loader, ttl, stale_ttl), daemon=True
+            ).start()
+        return entry[2]
+    
+    def _refresh(self, key: str, loader: Callable[[], Any], ttl: float, stale_ttl: float):
+        """Reload a stale entry; on failure the stale payload stays until it expires"""
+        try:
+            self.set(key, loader(), ttl, stale_ttl)
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+    
+    def invalidate(self, resource_type: str):
+        """
+        Drop every entry whose path includes a resource type
+        
+        A write to ``appStoreVersions/{id}`` evicts both that record and
+        lists such as ``apps/{app_id}/appStoreVersions``.
+        
+        Args:
+            resource_type: Path segment naming the resource, e.g. 'appStoreVersions'
+        """
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if resource_type in key.split('?', 1)[0].split('/')
+            ]
+            for key in stale:
+                del self._entries[key]
+    
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
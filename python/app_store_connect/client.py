@@ -2,15 +2,51 @@
 Main client for App Store Connect API
 """
 
-from typing import Optional, Dict, Any
+import importlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Tuple, List, NamedTuple
 from pathlib import Path
 
 from .auth import Auth
-from .api.apps import AppsAPI
-from .api.localizations import LocalizationsAPI, AppStoreVersionLocalizationsAPI
-from .api.versions import VersionsAPI
-from .api.media import MediaAPI
-from .api.categories import CategoriesAPI
+from .base import BaseAPI
+from .cache import TTLCache
+
+
+class BatchOp(NamedTuple):
+    """One request for Client.batch"""
+    method: str
+    path: str
+    body: Optional[Dict[str, Any]] = None
+    params: Optional[Dict[str, Any]] = None
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one BatchOp: the response on success, the exception otherwise"""
+    ok: bool
+    value: Optional[Dict[str, Any]] = None
+    error: Optional[Exception] = None
+
+
+# Clients built by Client.from_env, keyed on
+# (key_id, issuer_id, private_key_path, key file mtime)
+_client_cache: Dict[Tuple[str, str, str, Optional[int]], 'Client'] = {}
+_client_cache_lock = threading.Lock()
+
+
+@dataclass
+class VersionBundle:
+    """An app's current version with the records usually needed alongside it"""
+    __slots__ = ('version', 'build', 'phased_release', 'localizations', 'app')
+    
+    version: Dict[str, Any]
+    build: Optional[Dict[str, Any]]
+    phased_release: Optional[Dict[str, Any]]
+    localizations: List[Dict[str, Any]]
+    app: Dict[str, Any]
 
 
 class Client:
@@ -27,12 +63,29 @@ class Client:
         >>> apps = client.apps.get_all()
     """
     
+    # Seconds an app's resolved app info ID is reused before refetching
+    APP_INFO_CACHE_TTL = 300
+    
+    # API modules as (module, class name), imported and built on first
+    # access by __getattr__ so unused modules are never loaded
+    _API_MAP = {
+        'apps': ('.api.apps', 'AppsAPI'),
+        'localizations': ('.api.localizations', 'LocalizationsAPI'),
+        'version_localizations': ('.api.localizations', 'AppStoreVersionLocalizationsAPI'),
+        'versions': ('.api.versions', 'VersionsAPI'),
+        'media': ('.api.media', 'MediaAPI'),
+        'categories': ('.api.categories', 'CategoriesAPI'),
+        # Untyped requests issued by batch()
+        '_raw': ('.base', 'BaseAPI'),
+    }
+    
     def __init__(
         self,
         key_id: str,
         issuer_id: str,
         private_key_path: str,
-        auth: Optional[Auth] = None
+        auth: Optional[Auth] = None,
+        enable_caching: bool = False
     ):
         """
         Initialize the App Store Connect client
@@ -42,25 +95,54 @@ class Client:
             issuer_id: Your App Store Connect Issuer ID
             private_key_path: Path to your .p8 private key file
             auth: Optional Auth instance (if not provided, one will be created)
+            enable_caching: Reuse GET responses for a short, per-resource TTL
+                (see cache.PATH_TTLS); writes evict the affected resource type
         """
         if auth:
             self._auth = auth
         else:
             self._auth = Auth(key_id, issuer_id, private_key_path)
         
-        # Initialize API modules
-        self.apps = AppsAPI(self._auth)
-        self.localizations = LocalizationsAPI(self._auth)
-        self.version_localizations = AppStoreVersionLocalizationsAPI(self._auth)
-        self.versions = VersionsAPI(self._auth)
-        self.media = MediaAPI(self._auth)
-        self.categories = CategoriesAPI(self._auth)
+        # app_id -> (expires_at, app_info_id)
+        self._app_info_cache: Dict[str, Tuple[float, str]] = {}
+        
+        # One pooled session shared by every API module
+        self._session = BaseAPI.new_session()
+        
+        # One response cache shared by every API module, or None
+        self.cache = TTLCache() if enable_caching else None
+        
+        # Guards building API modules on first access from several threads
+        self._api_lock = threading.Lock()
+    
+    def __getattr__(self, name: str) -> Any:
+        """Build an API module from _API_MAP on first access and keep it"""
+        target = self._API_MAP.get(name)
+        if target is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        
+        with self._api_lock:
+            api = self.__dict__.get(name)
+            if api is None:
+                module_name, class_name = target
+                api_class = getattr(importlib.import_module(module_name, __package__), class_name)
+                api = api_class(self._auth, self._session)
+                api.cache = self.cache
+                # Stored on the instance, so later lookups skip __getattr__
+                self.__dict__[name] = api
+        return api
     
     @classmethod
     def from_env(cls, env_prefix: str = 'ASC') -> 'Client':
         """
         Create client from environment variables
         
+        Calls resolving to the same credentials return the same client, so
+        repeated calls reuse its session and parsed key; see clear_cache.
+        The shared client is process-wide, including its response cache.
+        Replacing the key file (a new modification time) builds a new client,
+        but changes elsewhere, such as a revoked key, are not noticed.
+        
         Environment variables:
             - {prefix}_KEY_ID: API Key ID
             - {prefix}_ISSUER_ID: Issuer ID
@@ -72,20 +154,35 @@ class Client:
         Returns:
             Configured Client instance
         """
-        import os
-        
         key_id = os.getenv(f'{env_prefix}_KEY_ID')
         issuer_id = os.getenv(f'{env_prefix}_ISSUER_ID')
         private_key_path = os.getenv(f'{env_prefix}_PRIVATE_KEY_PATH')
         
-        if not all([key_id, issuer_id, private_key_path]):
+        if not key_id or not issuer_id or not private_key_path:
             raise ValueError(
                 f"Missing required environment variables. "
                 f"Please set {env_prefix}_KEY_ID, {env_prefix}_ISSUER_ID, "
                 f"and {env_prefix}_PRIVATE_KEY_PATH"
             )
         
-        return cls(key_id, issuer_id, private_key_path)
+        try:
+            key_mtime = os.stat(private_key_path).st_mtime_ns
+        except OSError:
+            # Auth reports the missing or unreadable file
+            key_mtime = None
+        
+        key = (key_id, issuer_id, private_key_path, key_mtime)
+        with _client_cache_lock:
+            client = _client_cache.get(key)
+            if not isinstance(client, cls):
+                client = _client_cache[key] = cls(key_id, issuer_id, private_key_path)
+        return client
+    
+    @staticmethod
+    def clear_cache():
+        """Forget the clients from_env has built, so the next call creates a new one"""
+        with _client_cache_lock:
+            _client_cache.clear()
     
     def get_app_by_bundle_id(self, bundle_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -112,18 +209,97 @@ class Client:
             localizations: Dict mapping locale to localization attributes
             
         Returns:
-            Results dict mapping locale to success/error
+            Dict mapping locale to success/error
+        """
+        app_info_id = self._get_app_info_id(app_id)
+        
+        # Bulk update localizations
+        return self.localizations.bulk_update(app_info_id, localizations)
+    
+    def _get_app_info_id(self, app_id: str) -> str:
+        """
+        Resolve the app info ID for an app, reusing a recent lookup
+        
+        Args:
+            app_id: The app ID
+            
+        Returns:
+            ID of the first app info record
         """
-        # Get the app info
-        app_infos = self.apps.get_app_infos(app_id)
+        cached = self._app_info_cache.get(app_id)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+        
+        # Get the app info alongside the app in one request
+        app_infos = self.apps.get_with_relations(app_id, ['appInfos'])['appInfos']
         if not app_infos:
             raise ValueError(f"No app info found for app {app_id}")
         
         # Use the first available app info
         app_info_id = app_infos[0]['id']
+        self._app_info_cache[app_id] = (time.monotonic() + self.APP_INFO_CACHE_TTL, app_info_id)
+        return app_info_id
+    
+    def invalidate_app_info_cache(self, app_id: Optional[str] = None):
+        """
+        Forget cached app info IDs
         
-        # Bulk update localizations
-        return self.localizations.bulk_update(app_info_id, localizations)
+        Args:
+            app_id: Only forget this app (default: forget all)
+        """
+        if app_id is None:
+            self._app_info_cache.clear()
+        else:
+            self._app_info_cache.pop(app_id, None)
+    
+    def batch(self, operations: List[BatchOp], max_parallel: int = 10) -> List[BatchResult]:
+        """
+        Run independent requests concurrently
+        
+        The API has no batch endpoint, so this issues the requests in
+        parallel; total time is about that of the slowest one.
+        
+        Args:
+            operations: BatchOp (or (method, path[, body[, params]]) tuples)
+            max_parallel: Maximum number of requests in flight
+            
+        Returns:
+            One BatchResult per operation, in the same order; a failed
+            request does not stop the others
+            
+        Example:
+            >>> version, infos = client.batch([
+            ...     ('GET', f'appStoreVersions/{version_id}'),
+            ...     ('GET', f'apps/{app_id}/appInfos'),
+            ... ])
+        """
+        ops = [BatchOp(*op) for op in operations]
+        if not ops:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_parallel, len(ops))) as executor:
+            futures = [executor.submit(self._run_batch_op, op) for op in ops]
+        
+        results = []
+        for future in futures:
+            try:
+                results.append(BatchResult(True, value=future.result()))
+            except Exception as e:
+                results.append(BatchResult(False, error=e))
+        return results
+    
+    def _run_batch_op(self, op: BatchOp) -> Dict[str, Any]:
+        """Issue one BatchOp through the verb helpers so caching applies"""
+        method = op.method.upper()
+        if method == 'GET':
+            return self._raw.get(op.path, params=op.params)
+        elif method == 'POST':
+            return self._raw.post(op.path, data=op.body)
+        elif method == 'PATCH':
+            return self._raw.patch(op.path, data=op.body)
+        elif method == 'DELETE':
+            return self._raw.delete(op.path)
+        raise ValueError(f"Unsupported batch method: {op.method}")
     
     def get_current_version(self, app_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -137,6 +313,38 @@ class Client:
         """
         return self.versions.get_current(app_id)
     
+    def get_version_bundle(self, app_id: str) -> Optional[VersionBundle]:
+        """
+        Get the current version with its build, phased release, localizations and app
+        
+        The app is fetched alongside the version list, then the three
+        version records are fetched concurrently.
+        
+        Args:
+            app_id: The app ID
+            
+        Returns:
+            VersionBundle, or None if the app has no versions
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            app = executor.submit(self.apps.get_app, app_id)
+            version = self.versions.get_current(app_id)
+            if version is None:
+                return None
+            
+            version_id = version['id']
+            build = executor.submit(self.versions.get_build, version_id)
+            phased_release = executor.submit(self.versions.get_phased_release, version_id)
+            localizations = executor.submit(self.version_localizations.get_all, version_id)
+            
+            return VersionBundle(
+                version=version,
+                build=build.result(),
+                phased_release=phased_release.result(),
+                localizations=localizations.result(),
+                app=app.result()
+            )
+    
     def create_new_version(
         self,
         app_id: str,
@@ -2,10 +2,14 @@
 Custom exceptions for App Store Connect API wrapper
 """
 
+from typing import Optional
+
 
 class AppStoreConnectError(Exception):
     """Base exception for all App Store Connect errors"""
-    pass
+    
+    # HTTP status of the response that raised it, if any
+    status_code: Optional[int] = None
 
 
 class AuthenticationError(AppStoreConnectError):
@@ -15,7 +19,11 @@ class AuthenticationError(AppStoreConnectError):
 
 class RateLimitError(AppStoreConnectError):
     """Raised when API rate limit is exceeded"""
-    pass
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        # Seconds the server asked us to wait (Retry-After header), if given
+        self.retry_after = retry_after
 
 
 class NotFoundError(AppStoreConnectError):
@@ -0,0 +1,115 @@
+"""
+Client-side rate limiting for App Store Connect API requests
+"""
+
+import os
+import threading
+import time
+from typing import ClassVar, Dict
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket
+    
+    Allows bursts of up to ``burst`` requests, then paces callers to
+    ``rate_per_sec`` so batches stay under the server's rate limit
+    instead of failing with 429s part way through.
+    """
+    
+    # Smooths bursts from concurrent callers without serializing them
+    DEFAULT_PER_SECOND = 50
+    DEFAULT_BURST = 100
+    
+    # Limiters shared by every API module talking to the same host
+    _shared: ClassVar[Dict[str, 'RateLimiter']] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    def __init__(self, rate_per_sec: float, burst: int = 1):
+        """
+        Initialize rate limiter
+        
+        Args:
+            rate_per_sec: Sustained requests allowed per second
+            burst: Requests that may be made back to back before pacing starts
+        """
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        
+        self.rate = rate_per_sec
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_env(cls, env_var: str = 'ASC_RATE_LIMIT') -> 'RateLimiter':
+        """
+        Create a limiter from an environment variable
+        
+        Args:
+            env_var: Variable holding the allowed requests per minute
+                (default: 'ASC_RATE_LIMIT'); unset means DEFAULT_PER_SECOND * 60
+        
+        Returns:
+            Configured RateLimiter instance
+        """
+        value = os.getenv(env_var)
+        try:
+            per_minute = float(value) if value else cls.DEFAULT_PER_SECOND * 60
+        except ValueError:
+            raise ValueError(f"{env_var} must be a number of requests per minute, got {value!r}")
+        
+        return cls(per_minute / 60, burst=cls.DEFAULT_BURST)
+    
+    @classmethod
+    def shared(cls, key: str) -> 'RateLimiter':
+        """
+        Get the process-wide limiter for a key, creating it from the environment
+        
+        Args:
+            key: Usually the API host, so all clients of it share one budget
+        
+        Returns:
+            The shared RateLimiter instance
+        """
+        with cls._shared_lock:
+            limiter = cls._shared.get(key)
+            if limiter is None:
+                limiter = cls._shared[key] = cls.from_env()
+            return limiter
+    
+    def _refill(self):
+        """Add the tokens accrued since the last update"""
+        now = time.monotonic()
+        # _updated is in the future while paused; nothing accrues until then
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+    
+    def acquire(self):
+        """Take one token, blocking until one is available"""
+        with self._lock:
+            self._refill()
+            # A negative balance reserves a token that accrues later; each
+            # caller waits for its own place in line without holding the lock
+            self._tokens -= 1
+            wait = max(0.0, self._updated - time.monotonic()) + max(0.0, -self._tokens) / self.rate
+        if wait > 0:
+            time.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """
+        Drain the bucket and hold every caller for a number of seconds
+        
+        Used when the server answers 429 with Retry-After, so concurrent
+        callers back off together instead of each earning their own 429.
+        
+        Args:
+            seconds: Time before tokens start accruing again
+        """
+        with self._lock:
+            self._refill()
+            # Keep tokens already reserved by waiting callers
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, time.monotonic() + seconds)
@@ -90,10 +90,10 @@ def sync_localizations(client: Client, app_id: str, dry_run: bool = False):
     
     if dry_run:
         print("\nWould update the following localizations:")
-        for locale, data in localizations.items():
-            print(f"  {locale}:")
-            print(f"    Name: {data['name']}")
-            print(f"    Subtitle: {data['subtitle']}")
+        print("\n".join(
+            f"  {locale}:\n    Name: {data['name']}\n    Subtitle: {data['subtitle']}"
+            for locale, data in localizations.items()
+        ))
         return
     
     # Get app info
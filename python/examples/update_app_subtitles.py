@@ -231,9 +231,11 @@ def main():
     
     if failed_count > 0:
         print("\nFailed locales:")
-        for locale, result in results.items():
-            if not result.get('success'):
-                print(f"  - {locale}: {result.get('error')}")
+        print("\n".join(
+            f"  - {locale}: {result.get('error')}"
+            for locale, result in results.items()
+            if not result.get('success')
+        ))
     
     return 0 if failed_count == 0 else 1
 
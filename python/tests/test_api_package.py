@@ -0,0 +1,64 @@
+"""
+Tests for lazy exports of the api package
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+from app_store_connect import api
+from app_store_connect.api import media, versions
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_lazy_attribute_resolves_to_submodule_class():
+    """Test exports resolve to the classes defined in their submodules"""
+    assert api.MediaAPI is media.MediaAPI
+    # Cached on the package after the first lookup
+    assert vars(api)['MediaAPI'] is media.MediaAPI
+    from app_store_connect.api import BulkResult
+    from app_store_connect.api.localizations import BulkResult as defined
+    assert BulkResult is defined
+
+
+def test_unknown_attribute_raises():
+    """Test names outside the export table raise AttributeError"""
+    with pytest.raises(AttributeError, match="has no attribute 'NotAnAPI'"):
+        api.NotAnAPI
+    assert not hasattr(api, 'NotAnAPI')
+
+
+def test_all_and_dir_list_every_export():
+    """Test __all__ and dir() cover every lazy export"""
+    assert sorted(api.__all__) == sorted(api._LAZY)
+    assert set(api.__all__) <= set(dir(api))
+    for name in api.__all__:
+        assert getattr(api, name).__name__ == name
+
+
+
+def test_getattr_resolves_uncached_name(monkeypatch):
+    """Test a name missing from the package namespace goes through __getattr__"""
+    monkeypatch.delitem(vars(api), 'VersionsAPI', raising=False)
+    
+    assert api.__getattr__('VersionsAPI') is versions.VersionsAPI
+    assert vars(api)['VersionsAPI'] is versions.VersionsAPI
+
+
+def test_client_defers_api_module_imports():
+    """Test a Client loads only the API modules that are used"""
+    # A fresh interpreter, since this one has imported every module already
+    code = (
+        "import sys\n"
+        "from unittest.mock import MagicMock\n"
+        "from app_store_connect import Client\n"
+        "client = Client('KEY', 'ISSUER', '/unused.p8', auth=MagicMock(headers={}))\n"
+        "loaded = lambda name: f'app_store_connect.api.{name}' in sys.modules\n"
+        "assert not loaded('media') and not loaded('categories') and not loaded('apps')\n"
+        "client.apps\n"
+        "assert loaded('apps') and not loaded('media') and not loaded('categories')\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=Path(__file__).parent.parent)
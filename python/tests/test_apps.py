@@ -0,0 +1,113 @@
+"""
+Tests for apps API
+"""
+
+import sys
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from app_store_connect.api import apps as apps_mod
+from app_store_connect.api.apps import AppsAPI, BoundApp
+from app_store_connect.base import BaseAPI
+from app_store_connect.exceptions import AppStoreConnectError
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def apps_api(api_factory):
+    """AppsAPI with a stub auth and a session that is never used"""
+    return api_factory(AppsAPI)
+
+
+def test_bind_returns_same_object(api_factory, apps_api):
+    """Test repeated binds of one app share a BoundApp"""
+    app = apps_api.bind('app123')
+    
+    assert isinstance(app, BoundApp)
+    assert apps_api.bind('app123') is app
+    assert apps_api.bind('app456') is not app
+    # Bindings belong to their API instance
+    assert api_factory(AppsAPI).bind('app123') is not app
+
+
+def test_bound_app_paths(apps_api, monkeypatch):
+    """Test bound calls hit the app's interned relationship paths"""
+    requested = []
+    monkeypatch.setattr(
+        apps_api, '_list', lambda endpoint, params=None: requested.append(endpoint) or []
+    )
+    
+    app = apps_api.bind('app123')
+    app.app_infos()
+    app.versions()
+    app.builds()
+    
+    assert requested == [
+        'apps/app123/appInfos', 'apps/app123/appStoreVersions', 'apps/app123/builds'
+    ]
+    for path in requested:
+        assert sys.intern(path) is path
+
+
+def _paged_get(pages, fail_at=None):
+    """Stub for AppsAPI.get serving ``pages`` linked by 'next' URLs"""
+    requested = []
+    
+    def get(endpoint, params=None):
+        page = 0 if endpoint == 'apps' else int(endpoint.rsplit('=', 1)[1])
+        requested.append(page)
+        if page == fail_at:
+            raise AppStoreConnectError('API request failed with status 500')
+        response = {'data': [{'id': app_id} for app_id in pages[page]]}
+        if page + 1 < len(pages):
+            response['links'] = {'next': f'{BaseAPI.BASE_URL}apps?cursor={page + 1}'}
+        return response
+    
+    return get, requested
+
+
+def test_iter_all_yields_pages_in_order(apps_api, monkeypatch):
+    """Test every page is walked in order and the walk stops at the last one"""
+    get, requested = _paged_get([['a', 'b'], ['c'], ['d', 'e']])
+    monkeypatch.setattr(apps_api, 'get', get)
+    
+    assert [app['id'] for app in apps_api.iter_all()] == ['a', 'b', 'c', 'd', 'e']
+    assert requested == [0, 1, 2]
+
+
+def test_iter_all_shuts_down_when_consumer_stops(apps_api, monkeypatch):
+    """Test closing the iterator early shuts the prefetch executor down"""
+    shutdowns = []
+    
+    class RecordingExecutor(ThreadPoolExecutor):
+        def shutdown(self, *args, **kwargs):
+            shutdowns.append(self)
+            super().shutdown(*args, **kwargs)
+    
+    monkeypatch.setattr(apps_mod, 'ThreadPoolExecutor', RecordingExecutor)
+    get, requested = _paged_get([['a', 'b'], ['c'], ['d']])
+    monkeypatch.setattr(apps_api, 'get', get)
+    
+    apps = apps_api.iter_all()
+    assert next(apps)['id'] == 'a'
+    assert not shutdowns
+    apps.close()
+    
+    assert len(shutdowns) == 1
+    # At most the one page prefetched behind the consumer was requested
+    assert requested == [0, 1]
+
+
+def test_iter_all_raises_error_from_later_page(apps_api, monkeypatch):
+    """Test a failing page surfaces after the earlier pages were yielded"""
+    get, _ = _paged_get([['a'], ['b'], ['c']], fail_at=1)
+    monkeypatch.setattr(apps_api, 'get', get)
+    
+    seen = []
+    with pytest.raises(AppStoreConnectError):
+        for app in apps_api.iter_all():
+            seen.append(app['id'])
+    
+    assert seen == ['a']
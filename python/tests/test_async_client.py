@@ -0,0 +1,177 @@
+"""
+Tests for async client
+"""
+
+import asyncio
+import importlib.util
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from app_store_connect.async_client import AsyncClient
+from app_store_connect.auth import Auth
+from app_store_connect.base import BaseAPI
+from app_store_connect.exceptions import NotFoundError
+
+
+class FakeResponse:
+    """aiohttp-style response usable as an async context manager"""
+    
+    def __init__(self, status, body):
+        self.status = status
+        self.headers = {}
+        self._body = body
+    
+    async def text(self):
+        return json.dumps(self._body)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """aiohttp.ClientSession stand-in keyed on the path relative to BASE_URL"""
+    
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+    
+    def request(self, method, url, **kwargs):
+        path = url.replace(BaseAPI.BASE_URL, '')
+        self.calls.append(path)
+        status, body = self.responses.get(path, (404, {'errors': []}))
+        return FakeResponse(status, body)
+
+
+class TestAsyncClient(unittest.TestCase):
+    """Test cases for AsyncClient"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.mock_auth = MagicMock(spec=Auth)
+        self.mock_auth.headers = {'Authorization': 'Bearer test_token'}
+    
+    def _run(self, session, coro_fn):
+        async def run():
+            async with AsyncClient(
+                'KEY', 'ISSUER', '/unused.p8', auth=self.mock_auth, session=session
+            ) as client:
+                return await coro_fn(client)
+        return asyncio.run(run())
+    
+    def test_get_current_version(self):
+        """Test the current version is picked by state priority"""
+        session = FakeSession({
+            'apps/app123/appStoreVersions': (200, {'data': [
+                {'id': 'v2', 'attributes': {'appStoreState': 'PREPARE_FOR_SUBMISSION'}},
+                {'id': 'v1', 'attributes': {'appStoreState': 'READY_FOR_SALE'}},
+            ]})
+        })
+        
+        version = self._run(session, lambda client: client.get_current_version('app123'))
+        
+        self.assertEqual(version['id'], 'v1')
+    
+    def test_concurrent_requests_share_session(self):
+        """Test gathered calls all go through the injected session"""
+        session = FakeSession({
+            'appStoreVersions/v1/build': (200, {'data': {'id': 'build1'}}),
+            'appStoreVersions/v1/appStoreVersionPhasedRelease': (200, {'data': None}),
+        })
+        
+        async def gather(client):
+            return await asyncio.gather(
+                client.versions.get_build('v1'),
+                client.versions.get_phased_release('v1')
+            )
+        
+        build, phased_release = self._run(session, gather)
+        
+        self.assertEqual(build, {'id': 'build1'})
+        self.assertIsNone(phased_release)
+        self.assertEqual(len(session.calls), 2)
+    
+    def test_get_version_bundle(self):
+        """Test the bundle gathers the version's related records"""
+        session = FakeSession({
+            'apps/app123': (200, {'data': {'id': 'app123'}}),
+            'apps/app123/appStoreVersions': (200, {'data': [
+                {'id': 'v1', 'attributes': {'appStoreState': 'READY_FOR_SALE'}},
+            ]}),
+            'appStoreVersions/v1/build': (200, {'data': {'id': 'build1'}}),
+            'appStoreVersions/v1/appStoreVersionPhasedRelease': (200, {'data': None}),
+            'appStoreVersions/v1/appStoreVersionLocalizations': (200, {'data': [{'id': 'loc1'}]}),
+        })
+        
+        bundle = self._run(session, lambda client: client.get_version_bundle('app123'))
+        
+        self.assertEqual(bundle.version['id'], 'v1')
+        self.assertEqual(bundle.build, {'id': 'build1'})
+        self.assertIsNone(bundle.phased_release)
+        self.assertEqual(bundle.localizations, [{'id': 'loc1'}])
+        self.assertEqual(bundle.app, {'id': 'app123'})
+    
+    def test_get_all_follows_pages(self):
+        """Test list methods walk every page through the 'next' links"""
+        path = 'appStoreVersions/v1/appStoreVersionLocalizations'
+        session = FakeSession({
+            path: (200, {
+                'data': [{'id': 'loc1'}],
+                'links': {'next': f'{BaseAPI.BASE_URL}{path}?cursor=2'}
+            }),
+            f'{path}?cursor=2': (200, {'data': [{'id': 'loc2'}]}),
+        })
+        
+        localizations = self._run(
+            session, lambda client: client.version_localizations.get_all('v1')
+        )
+        
+        self.assertEqual(localizations, [{'id': 'loc1'}, {'id': 'loc2'}])
+        self.assertEqual(session.calls, [path, f'{path}?cursor=2'])
+    
+    def test_error_status_raises(self):
+        """Test error statuses map to the same exceptions as the sync client"""
+        with self.assertRaises(NotFoundError) as ctx:
+            self._run(FakeSession({}), lambda client: client.apps.get_app('missing'))
+        self.assertEqual(ctx.exception.status_code, 404)
+    
+    def test_package_import_defers_async_client(self):
+        """Test importing the package loads the async client only on request"""
+        code = (
+            "import sys\n"
+            "import app_store_connect\n"
+            "assert 'app_store_connect.async_client' not in sys.modules\n"
+            "from app_store_connect import AsyncClient\n"
+            "assert AsyncClient.__module__ == 'app_store_connect.async_client'\n"
+            # Transports are imported when a session is opened
+            "assert 'httpx' not in sys.modules and 'h2' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True, cwd=Path(__file__).parent.parent)
+    
+    @unittest.skipUnless(importlib.util.find_spec('httpx'), "httpx not installed")
+    def test_httpx_session(self):
+        """Test an injected httpx.AsyncClient is used as the transport"""
+        import httpx
+        
+        def handler(request):
+            return httpx.Response(200, json={'data': {'id': request.url.path.rsplit('/', 1)[-1]}})
+        
+        async def run():
+            session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with session:
+                async with AsyncClient(
+                    'KEY', 'ISSUER', '/unused.p8', auth=self.mock_auth, session=session
+                ) as client:
+                    return await client.apps.get_app('app123')
+        
+        self.assertEqual(asyncio.run(run()), {'id': 'app123'})
+
+
+if __name__ == '__main__':
+    unittest.main()
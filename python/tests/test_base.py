@@ -2,14 +2,15 @@
 Tests for base API class
 """
 
+import copy
+import functools
+import json
 import unittest
+import pytest
+from collections import namedtuple
 from unittest.mock import patch, MagicMock, Mock
-import requests
-from pathlib import Path
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from app_store_connect import base as base_mod
 from app_store_connect.base import BaseAPI
 from app_store_connect.auth import Auth
 from app_store_connect.exceptions import (
@@ -21,17 +22,96 @@ from app_store_connect.exceptions import (
 )
 
 
+pytestmark = pytest.mark.unit
+
+
+# (status, exception raised, message substring, error body)
+STATUS_ERROR_CASES = [
+    (401, AppStoreConnectError, "Authentication failed", None),
+    (403, AppStoreConnectError, "Forbidden", None),
+    (404, NotFoundError, "Resource not found", None),
+    (409, ConflictError, "Name already exists", {'errors': [{'title': 'Name already exists'}]}),
+    (422, ValidationError, "Invalid field value", {'errors': [{'detail': 'Invalid field value'}]}),
+    (429, RateLimitError, "API rate limit exceeded", None),
+    (500, AppStoreConnectError, "status 500", {'errors': [{'title': 'Internal error'}]}),
+]
+
+
+# The only attributes BaseAPI reads from a response and a session
+_RESPONSE_ATTRS = ['status_code', 'content', 'headers', 'json']
+_SESSION_ATTRS = ['request', 'mount', 'headers']
+
+# Plain GET responses only need a status and the raw body BaseAPI parses
+Resp = namedtuple('Resp', 'status_code content')
+
+
+@functools.lru_cache(maxsize=None)
+def _resp(status, body_json=None, headers=()):
+    """
+    Fake response, built once per distinct (status, body, headers)
+    
+    Shared across tests, so it must be treated as read-only. Arguments are
+    hashable: the body as JSON text and the headers as (name, value) pairs.
+    """
+    return Mock(
+        spec_set=_RESPONSE_ATTRS,
+        status_code=status,
+        content=b'' if body_json is None else body_json.encode(),
+        headers=dict(headers),
+        json=Mock(return_value=None if body_json is None else json.loads(body_json))
+    )
+
+
+# Spec'd once at import; tests take a shallow copy instead of re-specing Auth
+_AUTH_PROTOTYPE = MagicMock(spec=Auth, headers={
+    'Authorization': 'Bearer test_token',
+    'Content-Type': 'application/json'
+})
+
+
 class TestBaseAPI(unittest.TestCase):
     """Test cases for BaseAPI class"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the Auth mock and one BaseAPI (and its session) for the whole class"""
+        cls.mock_auth = copy.copy(_AUTH_PROTOTYPE)
+        cls.base_api = BaseAPI(cls.mock_auth)
+    
     def setUp(self):
-        """Set up test fixtures"""
-        self.mock_auth = MagicMock(spec=Auth)
-        self.mock_auth.headers = {
-            'Authorization': 'Bearer test_token',
-            'Content-Type': 'application/json'
-        }
-        self.base_api = BaseAPI(self.mock_auth)
+        """Reset the state a test may have left on the shared fixtures"""
+        # Copies share child mocks with the prototype, so clear earlier calls
+        self.mock_auth.reset_mock()
+        self.base_api._etag_cache.clear()
+        self.base_api.cache = None
+        
+        # Every BaseAPI built during a test gets a mock session
+        self._orig_session = base_mod.requests.Session
+        base_mod.requests.Session = self.mock_session_class = MagicMock()
+    
+    def tearDown(self):
+        """Restore the real requests.Session"""
+        base_mod.requests.Session = self._orig_session
+    
+    def _fake_session(self, status, json_body=None, headers=None):
+        """Make the next BaseAPI's session answer every request with one response"""
+        session = Mock(spec_set=_SESSION_ATTRS, headers={})
+        session.request.return_value = _resp(
+            status,
+            None if json_body is None else json.dumps(json_body),
+            tuple((headers or {}).items())
+        )
+        self.mock_session_class.return_value = session
+        return session
+    
+    def _assert_raises_with(self, exc_class, message, fn, *args, **kwargs):
+        """Assert fn(*args, **kwargs) raises exc_class with message in its text"""
+        try:
+            fn(*args, **kwargs)
+        except exc_class as e:
+            self.assertIn(message, str(e))
+        else:
+            self.fail(f"{exc_class.__name__} not raised")
     
     def test_init(self):
         """Test BaseAPI initialization"""
@@ -41,184 +121,117 @@ class TestBaseAPI(unittest.TestCase):
             self.base_api.session.headers['Authorization'],
             'Bearer test_token'
         )
+        adapter = self.base_api.session.get_adapter(BaseAPI.BASE_URL)
+        self.assertEqual(adapter._pool_maxsize, BaseAPI.POOL_MAXSIZE)
     
-    @patch('app_store_connect.base.requests.Session')
-    def test_request_success_200(self, mock_session_class):
+    def test_request_success_200(self):
         """Test successful request with 200 status"""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'data': 'test'}
-        
-        mock_session = MagicMock()
-        mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
+        self._fake_session(200, {'data': 'test'})
         
         api = BaseAPI(self.mock_auth)
         result = api._request('GET', 'test/endpoint')
         
         self.assertEqual(result, {'data': 'test'})
     
-    @patch('app_store_connect.base.requests.Session')
-    def test_request_success_201(self, mock_session_class):
+    def test_request_success_201(self):
         """Test successful request with 201 status"""
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {'created': True}
-        
-        mock_session = MagicMock()
-        mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
+        self._fake_session(201, {'created': True})
         
         api = BaseAPI(self.mock_auth)
         result = api._request('POST', 'test/endpoint')
         
         self.assertEqual(result, {'created': True})
     
-    @patch('app_store_connect.base.requests.Session')
-    def test_request_success_204(self, mock_session_class):
-        """Test successful request with 204 status (no content)"""
-        mock_response = MagicMock()
-        mock_response.status_code = 204
-        
-        mock_session = MagicMock()
-        mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
+    @patch('app_store_connect.base.orjson')
+    def test_request_body_encoded_with_orjson(self, mock_orjson):
+        """Test request bodies are pre-encoded when orjson is available"""
+        mock_orjson.dumps.return_value = b'{"name":"Test"}'
+        mock_session = self._fake_session(201, {})
         
         api = BaseAPI(self.mock_auth)
-        result = api._request('DELETE', 'test/endpoint')
+        api._request('POST', 'test/endpoint', data={'name': 'Test'})
         
-        self.assertEqual(result, {})
+        mock_orjson.dumps.assert_called_once_with({'name': 'Test'})
+        kwargs = mock_session.request.call_args.kwargs
+        self.assertIsNone(kwargs['json'])
+        self.assertEqual(kwargs['data'], b'{"name":"Test"}')
     
-    @patch('app_store_connect.base.requests.Session')
-    def test_request_auth_error(self, mock_session_class):
-        """Test authentication error (401)"""
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        
-        mock_session = MagicMock()
-        mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
+    def test_request_success_204(self):
+        """Test successful request with 204 status (no content)"""
+        self._fake_session(204)
         
         api = BaseAPI(self.mock_auth)
+        result = api._request('DELETE', 'test/endpoint')
         
-        with self.assertRaises(AppStoreConnectError) as context:
-            api._request('GET', 'test/endpoint')
-        
-        self.assertIn("Authentication failed", str(context.exception))
+        self.assertEqual(result, {})
     
-    @patch('app_store_connect.base.requests.Session')
-    def test_request_forbidden(self, mock_session_class):
-        """Test forbidden error (403)"""
-        mock_response = MagicMock()
-        mock_response.status_code = 403
-        
-        mock_session = MagicMock()
-        mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
-        
+    def test_request_error_statuses(self):
+        """Test each error status raises its exception with a useful message"""
+        # One API whose session answers with each case's response in turn
+        self.mock_session_class.return_value = Mock(spec_set=_SESSION_ATTRS, headers={})
         api = BaseAPI(self.mock_auth)
-        
-        with self.assertRaises(AppStoreConnectError) as context:
-            api._request('GET', 'test/endpoint')
-        
-        self.assertIn("Forbidden", str(context.exception))
+        api.session.request.side_effect = [
+            _resp(status, None if body is None else json.dumps(body))
+            for status, _, _, body in STATUS_ERROR_CASES
+        ]
+        
+        for status, exc_class, message, _ in STATUS_ERROR_CASES:
+            with self.subTest(status=status):
+                self._assert_raises_with(exc_class, message, api._request, 'GET', 'test/endpoint')
     
-    @patch('app_store_connect.base.requests.Session')
-    def test_request_not_found(self, mock_session_class):
-        """Test not found error (404)"""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        
-        mock_session = MagicMock()
-        mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
+    def test_request_rate_limit_pauses_limiter(self):
+        """Test a 429 with Retry-After pauses the shared limiter"""
+        self._fake_session(429, headers={'Retry-After': '7'})
         
         api = BaseAPI(self.mock_auth)
+        api.rate_limiter = MagicMock()
         
-        with self.assertRaises(NotFoundError) as context:
+        with self.assertRaises(RateLimitError) as context:
             api._request('GET', 'test/endpoint')
         
-        self.assertIn("Resource not found", str(context.exception))
-    
-    @patch('app_store_connect.base.requests.Session')
-    def test_request_conflict(self, mock_session_class):
-        """Test conflict error (409)"""
-        mock_response = MagicMock()
-        mock_response.status_code = 409
-        mock_response.json.return_value = {
-            'errors': [{'title': 'Name already exists'}]
-        }
-        
-        mock_session = MagicMock()
-        mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
-        
-        api = BaseAPI(self.mock_auth)
-        
-        with self.assertRaises(ConflictError) as context:
-            api._request('POST', 'test/endpoint')
-        
-        self.assertIn("Name already exists", str(context.exception))
-    
-    @patch('app_store_connect.base.requests.Session')
-    def test_request_validation_error(self, mock_session_class):
-        """Test validation error (422)"""
-        mock_response = MagicMock()
-        mock_response.status_code = 422
-        mock_response.json.return_value = {
-            'errors': [{'detail': 'Invalid field value'}]
-        }
-        
-        mock_session = MagicMock()
-        mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
-        
-        api = BaseAPI(self.mock_auth)
-        
-        with self.assertRaises(ValidationError) as context:
-            api._request('POST', 'test/endpoint')
-        
-        self.assertIn("Invalid field value", str(context.exception))
+        api.rate_limiter.acquire.assert_called_once_with()
+        api.rate_limiter.pause.assert_called_once_with(7.0)
+        self.assertEqual(context.exception.retry_after, 7.0)
     
-    @patch('app_store_connect.base.requests.Session')
-    def test_request_rate_limit(self, mock_session_class):
-        """Test rate limit error (429)"""
-        mock_response = MagicMock()
-        mock_response.status_code = 429
+    def test_get_with_etag_reuses_body_on_304(self):
+        """Test conditional GET sends If-None-Match and reuses the cached body"""
+        first_response = Mock(
+            spec_set=_RESPONSE_ATTRS,
+            status_code=200,
+            headers={'ETag': '"abc"'},
+            content=json.dumps({'data': [{'id': '1'}]}).encode()
+        )
+        not_modified = Mock(spec_set=_RESPONSE_ATTRS, status_code=304)
         
-        mock_session = MagicMock()
-        mock_session.request.return_value = mock_response
-        mock_session_class.return_value = mock_session
+        mock_session = Mock(spec_set=_SESSION_ATTRS, headers={})
+        mock_session.request.side_effect = [first_response, not_modified]
+        self.mock_session_class.return_value = mock_session
         
         api = BaseAPI(self.mock_auth)
+        first = api.get('test/endpoint', params={'limit': 200}, use_etag=True)
+        second = api.get('test/endpoint', params={'limit': 200}, use_etag=True)
         
-        with self.assertRaises(RateLimitError) as context:
-            api._request('GET', 'test/endpoint')
-        
-        self.assertIn("API rate limit exceeded", str(context.exception))
+        self.assertEqual(second, first)
+        self.assertNotIn('headers', mock_session.request.call_args_list[0].kwargs)
+        self.assertEqual(
+            mock_session.request.call_args_list[1].kwargs['headers'],
+            {'If-None-Match': '"abc"'}
+        )
     
-    @patch('app_store_connect.base.requests.Session')
-    def test_get_all_pages(self, mock_session_class):
+    def test_get_all_pages(self):
         """Test pagination handling"""
-        # First page response
-        first_response = MagicMock()
-        first_response.status_code = 200
-        first_response.json.return_value = {
+        first_response = Resp(200, json.dumps({
             'data': [{'id': '1'}, {'id': '2'}],
             'links': {'next': 'https://api.appstoreconnect.apple.com/v1/next_page'}
-        }
-        
-        # Second page response
-        second_response = MagicMock()
-        second_response.status_code = 200
-        second_response.json.return_value = {
+        }).encode())
+        second_response = Resp(200, json.dumps({
             'data': [{'id': '3'}],
             'links': {}  # No next page
-        }
+        }).encode())
         
-        mock_session = MagicMock()
+        mock_session = Mock(spec_set=_SESSION_ATTRS, headers={})
         mock_session.request.side_effect = [first_response, second_response]
-        mock_session_class.return_value = mock_session
+        self.mock_session_class.return_value = mock_session
         
         api = BaseAPI(self.mock_auth)
         result = api.get_all_pages('test/endpoint')
@@ -227,62 +240,60 @@ class TestBaseAPI(unittest.TestCase):
         self.assertEqual(result[0]['id'], '1')
         self.assertEqual(result[2]['id'], '3')
     
-    def test_get_method(self):
-        """Test GET method wrapper"""
-        with patch.object(self.base_api, '_request') as mock_request:
-            mock_request.return_value = {'success': True}
-            
-            result = self.base_api.get('test/endpoint', params={'filter': 'test'})
-            
-            mock_request.assert_called_once_with(
-                'GET',
-                'test/endpoint',
-                params={'filter': 'test'}
-            )
-            self.assertEqual(result, {'success': True})
-    
-    def test_post_method(self):
-        """Test POST method wrapper"""
-        with patch.object(self.base_api, '_request') as mock_request:
-            mock_request.return_value = {'created': True}
-            
-            data = {'name': 'Test'}
-            result = self.base_api.post('test/endpoint', data)
-            
-            mock_request.assert_called_once_with(
-                'POST',
-                'test/endpoint',
-                data=data
-            )
-            self.assertEqual(result, {'created': True})
+    def test_get_all_pages_subclass_get(self):
+        """Test pagination ignores a subclass's get() and leaves params untouched"""
+        mock_session = self._fake_session(200, {'data': [{'id': '1'}], 'links': {}})
+        
+        class RecordAPI(BaseAPI):
+            def get(self, record_id):
+                raise AssertionError('get_all_pages must not call the subclass get()')
+        
+        params = {'filter[platform]': 'IOS'}
+        result = RecordAPI(self.mock_auth).get_all_pages('test/endpoint', params=params)
+        
+        self.assertEqual(result, [{'id': '1'}])
+        self.assertEqual(params, {'filter[platform]': 'IOS'})
+        self.assertEqual(
+            mock_session.request.call_args.kwargs['params'],
+            {'filter[platform]': 'IOS', 'limit': 200}
+        )
     
-    def test_patch_method(self):
-        """Test PATCH method wrapper"""
+    def test_verb_wrappers(self):
+        """Test GET/POST/PATCH/DELETE wrappers forward to _request"""
+        cases = [
+            ('get', ('test/endpoint',), {'params': {'filter': 'test'}},
+             ('GET', 'test/endpoint'), {'params': {'filter': 'test'}}),
+            ('post', ('test/endpoint', {'name': 'Test'}), {},
+             ('POST', 'test/endpoint'), {'data': {'name': 'Test'}}),
+            ('patch', ('test/endpoint', {'name': 'Updated'}), {},
+             ('PATCH', 'test/endpoint'), {'data': {'name': 'Updated'}}),
+            ('delete', ('test/endpoint',), {},
+             ('DELETE', 'test/endpoint'), {}),
+        ]
+        
         with patch.object(self.base_api, '_request') as mock_request:
-            mock_request.return_value = {'updated': True}
-            
-            data = {'name': 'Updated'}
-            result = self.base_api.patch('test/endpoint', data)
-            
-            mock_request.assert_called_once_with(
-                'PATCH',
-                'test/endpoint',
-                data=data
-            )
-            self.assertEqual(result, {'updated': True})
+            for verb, args, kwargs, expected_args, expected_kwargs in cases:
+                with self.subTest(verb=verb):
+                    mock_request.reset_mock()
+                    mock_request.return_value = {verb: True}
+                    
+                    result = getattr(self.base_api, verb)(*args, **kwargs)
+                    
+                    mock_request.assert_called_once_with(*expected_args, **expected_kwargs)
+                    self.assertEqual(result, {verb: True})
     
-    def test_delete_method(self):
-        """Test DELETE method wrapper"""
+    def test_list_and_item_helpers(self):
+        """Test envelope helpers unwrap 'data'"""
         with patch.object(self.base_api, '_request') as mock_request:
-            mock_request.return_value = {}
+            mock_request.return_value = {'data': [{'id': '1'}]}
+            self.assertEqual(self.base_api._list('test/endpoint'), [{'id': '1'}])
+            mock_request.assert_called_once_with('GET', 'test/endpoint', params=None)
             
-            result = self.base_api.delete('test/endpoint')
+            mock_request.return_value = {'data': None}
+            self.assertEqual(self.base_api._list('test/endpoint'), [])
             
-            mock_request.assert_called_once_with(
-                'DELETE',
-                'test/endpoint'
-            )
-            self.assertEqual(result, {})
+            mock_request.return_value = {'data': {'id': '1'}}
+            self.assertEqual(self.base_api._item('test/endpoint'), {'id': '1'})
 
 
 if __name__ == '__main__':
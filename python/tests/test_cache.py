@@ -0,0 +1,123 @@
+"""
+Tests for response cache
+"""
+
+import unittest
+import pytest
+from unittest.mock import patch, MagicMock
+
+from app_store_connect.auth import Auth
+from app_store_connect.base import BaseAPI
+from app_store_connect.cache import TTLCache
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for TTLCache class"""
+    
+    def test_key_sorts_params(self):
+        """Test parameter order does not change the key"""
+        self.assertEqual(
+            TTLCache.make_key('apps', {'b': 2, 'a': 1}),
+            TTLCache.make_key('apps', {'a': 1, 'b': 2})
+        )
+    
+    def test_ttl_by_resource_type(self):
+        """Test nested version lists use the version TTL"""
+        self.assertEqual(TTLCache.ttl_for('apps/123'), 300)
+        self.assertEqual(TTLCache.ttl_for('apps/123/appStoreVersions'), 60)
+    
+    @patch('app_store_connect.cache.time.monotonic')
+    def test_entries_expire(self, mock_monotonic):
+        """Test entries are dropped once their TTL passes"""
+        cache = TTLCache()
+        mock_monotonic.return_value = 100.0
+        cache.set('apps?', {'data': []}, ttl=10)
+        
+        mock_monotonic.return_value = 109.0
+        self.assertEqual(cache.get('apps?'), {'data': []})
+        
+        mock_monotonic.return_value = 110.0
+        self.assertIsNone(cache.get('apps?'))
+        self.assertEqual(len(cache), 0)
+    
+    def test_invalidate_resource_type(self):
+        """Test a write evicts the record and lists that contain its type"""
+        cache = TTLCache()
+        cache.set('appStoreVersions/v1?', {}, ttl=60)
+        cache.set('apps/123/appStoreVersions?', {}, ttl=60)
+        cache.set('apps/123?', {}, ttl=60)
+        
+        cache.invalidate('appStoreVersions')
+        
+        self.assertEqual(len(cache), 1)
+        self.assertIsNotNone(cache.get('apps/123?'))
+    
+    @patch('app_store_connect.cache.threading.Thread')
+    @patch('app_store_connect.cache.time.monotonic')
+    def test_fetch_with_swr(self, mock_monotonic, mock_thread):
+        """Test stale entries are served while one background refresh runs"""
+        cache = TTLCache()
+        loader = MagicMock(side_effect=['v1', 'v2'])
+        
+        mock_monotonic.return_value = 100.0
+        self.assertEqual(cache.fetch_with_swr('k', loader, ttl=10, stale_ttl=100), 'v1')
+        
+        # Stale: old value comes back and a single refresh is scheduled
+        mock_monotonic.return_value = 150.0
+        self.assertEqual(cache.fetch_with_swr('k', loader, ttl=10, stale_ttl=100), 'v1')
+        self.assertEqual(cache.fetch_with_swr('k', loader, ttl=10, stale_ttl=100), 'v1')
+        mock_thread.assert_called_once()
+        
+        refresh = mock_thread.call_args.kwargs
+        refresh['target'](*refresh['args'])
+        self.assertEqual(cache.fetch_with_swr('k', loader, ttl=10, stale_ttl=100), 'v2')
+        self.assertEqual(loader.call_count, 2)
+    
+    def test_base_api_get_uses_cache(self):
+        """Test repeated GETs are served from the cache until a write"""
+        mock_auth = MagicMock(spec=Auth)
+        mock_auth.headers = {'Authorization': 'Bearer test_token'}
+        api = BaseAPI(mock_auth)
+        api.cache = TTLCache()
+        
+        with patch.object(api, '_request', return_value={'data': []}) as mock_request:
+            api.get('apps/123/appStoreVersions')
+            api.get('apps/123/appStoreVersions')
+            self.assertEqual(mock_request.call_count, 1)
+            
+            api.patch('appStoreVersions/v1', data={})
+            api.get('apps/123/appStoreVersions')
+            self.assertEqual(mock_request.call_count, 3)
+
+    
+    def test_writes_evict_related_resources(self):
+        """Test list helpers are cached and writes evict lists of the types they touch"""
+        mock_auth = MagicMock(spec=Auth)
+        mock_auth.headers = {'Authorization': 'Bearer test_token'}
+        api = BaseAPI(mock_auth)
+        api.cache = TTLCache()
+        
+        with patch.object(api, '_request', return_value={'data': []}) as mock_request:
+            api._list('apps/123/appStoreVersions')
+            api._list('appStoreVersions/v1/appStoreVersionLocalizations')
+            api._list('builds/b1')
+            self.assertEqual(mock_request.call_count, 3)
+            
+            # Creating a localization leaves the versions list cached
+            api.post('appStoreVersionLocalizations', data={})
+            api._list('apps/123/appStoreVersions')
+            api._list('appStoreVersions/v1/appStoreVersionLocalizations')
+            self.assertEqual(mock_request.call_count, 5)
+            
+            # A relationship write evicts both ends
+            api.patch('appStoreVersions/v1/relationships/builds', data={})
+            api._list('apps/123/appStoreVersions')
+            api._list('builds/b1')
+            self.assertEqual(mock_request.call_count, 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
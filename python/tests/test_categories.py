@@ -0,0 +1,120 @@
+"""
+Tests for categories API
+"""
+
+import pytest
+from unittest.mock import patch
+
+from app_store_connect.api.categories import CategoriesAPI
+
+
+pytestmark = pytest.mark.unit
+
+
+# Shaped like a real appCategories listing: IDs and platforms, no display names
+CATEGORIES_RESPONSE = {'data': [
+    {'type': 'appCategories', 'id': 'GAMES', 'attributes': {'platforms': ['IOS']}},
+    {'type': 'appCategories', 'id': 'GAMES_ACTION', 'attributes': {'platforms': ['IOS']}},
+    {'type': 'appCategories', 'id': 'PHOTO_AND_VIDEO', 'attributes': {'platforms': ['IOS']}},
+]}
+
+
+@pytest.fixture(autouse=True)
+def fresh_shared_cache():
+    """Start and end every test with no process-wide category list"""
+    CategoriesAPI.invalidate_categories_cache()
+    yield
+    CategoriesAPI.invalidate_categories_cache()
+
+
+@pytest.fixture
+def mock_request():
+    """Answer every CategoriesAPI request with CATEGORIES_RESPONSE"""
+    with patch.object(CategoriesAPI, '_request', return_value=CATEGORIES_RESPONSE) as mock:
+        yield mock
+
+
+def test_categories_fetched_once_across_instances(api_factory, mock_request):
+    """Test one fetch per platform is shared by every instance"""
+    first, second = api_factory(CategoriesAPI), api_factory(CategoriesAPI)
+    
+    assert first.get_all_categories() == CATEGORIES_RESPONSE['data']
+    assert second.get_all_categories() is first.get_all_categories()
+    assert mock_request.call_count == 1
+    
+    second.get_all_categories(platform='MAC_OS')
+    assert mock_request.call_count == 2
+    assert mock_request.call_args.kwargs['params']['filter[platforms]'] == 'MAC_OS'
+
+
+@patch('app_store_connect.api.categories.time.monotonic')
+def test_categories_refetched_after_ttl(mock_monotonic, api_factory, mock_request):
+    """Test the shared list is refreshed once CATEGORIES_CACHE_TTL passes"""
+    api = api_factory(CategoriesAPI)
+    
+    mock_monotonic.return_value = 1000.0
+    api.get_all_categories()
+    mock_monotonic.return_value = 1000.0 + CategoriesAPI.CATEGORIES_CACHE_TTL - 1
+    api.get_all_categories()
+    assert mock_request.call_count == 1
+    
+    mock_monotonic.return_value = 1000.0 + CategoriesAPI.CATEGORIES_CACHE_TTL
+    api.get_all_categories()
+    assert mock_request.call_count == 2
+    # Refreshes revalidate with the last ETag
+    assert mock_request.call_args.kwargs['etag_key'] is not None
+
+
+def test_category_lookup_by_name_and_id(api_factory, mock_request):
+    """Test lookups by display name and ID hit the same records"""
+    api = api_factory(CategoriesAPI)
+    
+    games = api.get_category_by_name('Games')
+    assert games['id'] == 'GAMES'
+    assert api.get_category_by_id('GAMES') is games
+    assert api.get_category_by_name('Photo & Video')['id'] == 'PHOTO_AND_VIDEO'
+    assert api.get_category_by_id('GAMES_ACTION')['id'] == 'GAMES_ACTION'
+    assert api.get_category_by_name('Unknown') is None
+    assert api.get_category_by_id('UNKNOWN') is None
+    assert mock_request.call_count == 1
+
+
+def test_static_key_lookups():
+    """Test display names map to keys and unknown ones are rejected"""
+    assert CategoriesAPI.category_key_from_name('Photo & Video') == 'PHOTO_AND_VIDEO'
+    assert CategoriesAPI.category_key_from_name('Not a category') is None
+    assert CategoriesAPI.subcategory_key_from_name('Role Playing') == 'ROLE_PLAYING'
+    assert CategoriesAPI.subcategory_key_from_name('Pets', 'MAGAZINES_AND_NEWSPAPERS') == 'PETS'
+    with pytest.raises(ValueError):
+        CategoriesAPI.subcategory_key_from_name('Action', 'BOOKS')
+
+
+def test_set_game_category_rejects_unknown_subcategory(api_factory, mock_request):
+    """Test invalid game subcategories raise before any PATCH"""
+    api = api_factory(CategoriesAPI)
+    
+    with pytest.raises(ValueError):
+        api.set_game_category('info1', 'NOT_A_SUBCATEGORY')
+    with pytest.raises(ValueError):
+        api.set_game_category('info1', 'ACTION', 'NOT_A_SUBCATEGORY')
+    
+    assert [c.args[0] for c in mock_request.call_args_list] == ['GET']
+
+
+def test_update_app_categories_without_changes_is_noop(api_factory, mock_request):
+    """Test an update with nothing to change sends no request"""
+    assert api_factory(CategoriesAPI).update_app_categories('info1') == {}
+    mock_request.assert_not_called()
+
+
+def test_set_game_category_finds_games_by_name(api_factory, mock_request):
+    """Test set_game_category resolves Games without a displayName in the response"""
+    api = api_factory(CategoriesAPI)
+    
+    api.set_game_category('info1', 'ACTION')
+    
+    patch_call = mock_request.call_args_list[-1]
+    assert patch_call.args[:2] == ('PATCH', 'appInfos/info1')
+    body = patch_call.kwargs['data']['data']
+    assert body['relationships']['primaryCategory']['data']['id'] == 'GAMES'
+    assert body['attributes'] == {'primarySubcategoryOne': 'ACTION'}
@@ -2,207 +2,219 @@
 Tests for main client
 """
 
-import unittest
-from unittest.mock import patch, MagicMock, Mock
-from pathlib import Path
+import pytest
+from unittest.mock import patch
 import os
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from app_store_connect.client import Client
-from app_store_connect.auth import Auth
 
 
-class TestClient(unittest.TestCase):
-    """Test cases for Client class"""
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Drop clients from_env shared during a test so tests do not depend on order"""
+    yield
+    Client.clear_cache()
+
+
+def test_init_with_credentials(mock_client):
+    """Test client initialization with credentials"""
+    assert mock_client.apps is not None
+    assert mock_client.localizations is not None
+    assert mock_client.version_localizations is not None
+    assert mock_client.versions is not None
+    # Every module shares one pooled session
+    assert mock_client.apps.session is mock_client.versions.session
+
+
+def test_init_with_auth_object(mock_client):
+    """Test client initialization with Auth object"""
+    auth = mock_client._auth
+    client = Client(
+        key_id="ignored",
+        issuer_id="ignored",
+        private_key_path="ignored",
+        auth=auth
+    )
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.key_id = "TEST_KEY_ID"
-        self.issuer_id = "TEST_ISSUER_ID"
-        self.private_key_path = "/path/to/test.p8"
+    assert client._auth is auth
+
+
+def test_api_modules_built_on_first_access(mock_client):
+    """Test API modules are created lazily, once, with the client's cache"""
+    client = Client(key_id="ignored", issuer_id="ignored", private_key_path="ignored",
+                    auth=mock_client._auth, enable_caching=True)
+    assert 'media' not in vars(client)
     
-    @patch('app_store_connect.auth.Path.exists', return_value=True)
-    @patch('builtins.open')
-    def test_init_with_credentials(self, mock_open, mock_exists):
-        """Test client initialization with credentials"""
-        mock_open.return_value.__enter__.return_value.read.return_value = "mock_key"
-        
-        client = Client(
-            key_id=self.key_id,
-            issuer_id=self.issuer_id,
-            private_key_path=self.private_key_path
-        )
-        
-        self.assertIsNotNone(client.apps)
-        self.assertIsNotNone(client.localizations)
-        self.assertIsNotNone(client.version_localizations)
-        self.assertIsNotNone(client.versions)
-    
-    @patch('app_store_connect.auth.Path.exists', return_value=True)
-    @patch('builtins.open')
-    def test_init_with_auth_object(self, mock_open, mock_exists):
-        """Test client initialization with Auth object"""
-        mock_open.return_value.__enter__.return_value.read.return_value = "mock_key"
-        
-        auth = Auth(self.key_id, self.issuer_id, self.private_key_path)
-        client = Client(
-            key_id="ignored",
-            issuer_id="ignored",
-            private_key_path="ignored",
-            auth=auth
-        )
-        
-        self.assertEqual(client._auth, auth)
+    media = client.media
     
-    @patch.dict(os.environ, {
+    assert client.media is media
+    assert media.cache is client.cache
+    with pytest.raises(AttributeError):
+        client.not_an_api
+
+
+def test_from_env(fake_key):
+    """Test client creation from environment variables"""
+    with patch.dict(os.environ, {
         'ASC_KEY_ID': 'ENV_KEY_ID',
         'ASC_ISSUER_ID': 'ENV_ISSUER_ID',
-        'ASC_PRIVATE_KEY_PATH': '/env/path/key.p8'
-    })
-    @patch('app_store_connect.auth.Path.exists', return_value=True)
-    @patch('builtins.open')
-    def test_from_env(self, mock_open, mock_exists):
-        """Test client creation from environment variables"""
-        mock_open.return_value.__enter__.return_value.read.return_value = "mock_key"
-        
+        'ASC_PRIVATE_KEY_PATH': fake_key
+    }):
         client = Client.from_env()
-        
-        self.assertIsNotNone(client)
-        self.assertEqual(client._auth.key_id, 'ENV_KEY_ID')
-        self.assertEqual(client._auth.issuer_id, 'ENV_ISSUER_ID')
-    
-    @patch.dict(os.environ, {})
-    def test_from_env_missing_vars(self):
-        """Test from_env with missing environment variables"""
-        with self.assertRaises(ValueError) as context:
-            Client.from_env()
-        
-        self.assertIn("Missing required environment variables", str(context.exception))
     
-    @patch('app_store_connect.auth.Path.exists', return_value=True)
-    @patch('builtins.open')
-    def test_get_app_by_bundle_id(self, mock_open, mock_exists):
-        """Test getting app by bundle ID"""
-        mock_open.return_value.__enter__.return_value.read.return_value = "mock_key"
-        
-        client = Client(
-            key_id=self.key_id,
-            issuer_id=self.issuer_id,
-            private_key_path=self.private_key_path
-        )
-        
-        # Mock the apps API
-        client.apps.get_by_bundle_id = MagicMock(return_value={'id': 'app123'})
-        
-        result = client.get_app_by_bundle_id('com.example.app')
-        
-        self.assertEqual(result, {'id': 'app123'})
-        client.apps.get_by_bundle_id.assert_called_once_with('com.example.app')
-    
-    @patch('app_store_connect.auth.Path.exists', return_value=True)
-    @patch('builtins.open')
-    def test_update_app_localizations(self, mock_open, mock_exists):
-        """Test updating app localizations"""
-        mock_open.return_value.__enter__.return_value.read.return_value = "mock_key"
-        
-        client = Client(
-            key_id=self.key_id,
-            issuer_id=self.issuer_id,
-            private_key_path=self.private_key_path
-        )
-        
-        # Mock the APIs
-        client.apps.get_app_infos = MagicMock(return_value=[{'id': 'info123'}])
-        client.localizations.bulk_update = MagicMock(return_value={
-            'en-US': {'success': True}
-        })
-        
-        localizations = {'en-US': {'name': 'Test App'}}
-        result = client.update_app_localizations('app123', localizations)
-        
-        self.assertEqual(result, {'en-US': {'success': True}})
-        client.apps.get_app_infos.assert_called_once_with('app123')
-        client.localizations.bulk_update.assert_called_once_with('info123', localizations)
-    
-    @patch('app_store_connect.auth.Path.exists', return_value=True)
-    @patch('builtins.open')
-    def test_update_app_localizations_no_info(self, mock_open, mock_exists):
-        """Test updating app localizations with no app info"""
-        mock_open.return_value.__enter__.return_value.read.return_value = "mock_key"
-        
-        client = Client(
-            key_id=self.key_id,
-            issuer_id=self.issuer_id,
-            private_key_path=self.private_key_path
-        )
+    assert client is not None
+    assert client._auth.key_id == 'ENV_KEY_ID'
+    assert client._auth.issuer_id == 'ENV_ISSUER_ID'
+
+
+def test_from_env_reuses_client(fake_key):
+    """Test from_env returns one client per set of credentials until cleared"""
+    env = {
+        'ASC_KEY_ID': 'REUSE_KEY_ID',
+        'ASC_ISSUER_ID': 'REUSE_ISSUER_ID',
+        'ASC_PRIVATE_KEY_PATH': fake_key
+    }
+    with patch.dict(os.environ, env):
+        client = Client.from_env()
+        assert Client.from_env() is client
         
-        # Mock empty app infos
-        client.apps.get_app_infos = MagicMock(return_value=[])
+        Client.clear_cache()
+        assert Client.from_env() is not client
+
+
+def test_from_env_rebuilds_after_key_rotation(fake_key):
+    """Test replacing the key file gives a new client with the new key"""
+    env = {
+        'ASC_KEY_ID': 'ROTATE_KEY_ID',
+        'ASC_ISSUER_ID': 'ROTATE_ISSUER_ID',
+        'ASC_PRIVATE_KEY_PATH': fake_key
+    }
+    with patch.dict(os.environ, env):
+        client = Client.from_env()
         
-        with self.assertRaises(ValueError) as context:
-            client.update_app_localizations('app123', {})
+        stat = os.stat(fake_key)
+        os.utime(fake_key, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
         
-        self.assertIn("No app info found", str(context.exception))
+        rotated = Client.from_env()
+        assert rotated is not client
+        assert Client.from_env() is rotated
+
+
+@patch.dict(os.environ, {}, clear=True)
+def test_from_env_missing_vars():
+    """Test from_env with missing environment variables"""
+    with pytest.raises(ValueError, match="Missing required environment variables"):
+        Client.from_env()
+
+
+# (sub-API method, client method, args, kwargs, return value)
+FORWARDER_CASES = [
+    ('apps.get_by_bundle_id', 'get_app_by_bundle_id', ('com.example.app',), {}, {'id': 'app123'}),
+    ('versions.get_current', 'get_current_version', ('app123',), {}, {'version': '1.0.0'}),
+    ('versions.create', 'create_new_version', ('app123', '1.0.1'), {'platform': 'IOS'},
+     {'id': 'v123'}),
+    ('versions.submit_for_review', 'submit_for_review', ('v123',), {}, {'status': 'submitted'}),
+]
+
+
+@pytest.mark.parametrize(
+    "sub_attr,client_method,args,kwargs,ret",
+    FORWARDER_CASES,
+    ids=[case[1] for case in FORWARDER_CASES]
+)
+def test_forwarder(mock_client, stub_api, sub_attr, client_method, args, kwargs, ret):
+    """Test that convenience methods pass straight through to the sub-API"""
+    sub_method = stub_api(sub_attr, ret)
     
-    @patch('app_store_connect.auth.Path.exists', return_value=True)
-    @patch('builtins.open')
-    def test_get_current_version(self, mock_open, mock_exists):
-        """Test getting current version"""
-        mock_open.return_value.__enter__.return_value.read.return_value = "mock_key"
-        
-        client = Client(
-            key_id=self.key_id,
-            issuer_id=self.issuer_id,
-            private_key_path=self.private_key_path
-        )
-        
-        client.versions.get_current = MagicMock(return_value={'version': '1.0.0'})
-        
-        result = client.get_current_version('app123')
-        
-        self.assertEqual(result, {'version': '1.0.0'})
-        client.versions.get_current.assert_called_once_with('app123')
-    
-    @patch('app_store_connect.auth.Path.exists', return_value=True)
-    @patch('builtins.open')
-    def test_create_new_version(self, mock_open, mock_exists):
-        """Test creating new version"""
-        mock_open.return_value.__enter__.return_value.read.return_value = "mock_key"
-        
-        client = Client(
-            key_id=self.key_id,
-            issuer_id=self.issuer_id,
-            private_key_path=self.private_key_path
-        )
-        
-        client.versions.create = MagicMock(return_value={'id': 'v123'})
-        
-        result = client.create_new_version('app123', '1.0.1', platform='IOS')
-        
-        self.assertEqual(result, {'id': 'v123'})
-        client.versions.create.assert_called_once_with('app123', '1.0.1', platform='IOS')
-    
-    @patch('app_store_connect.auth.Path.exists', return_value=True)
-    @patch('builtins.open')
-    def test_submit_for_review(self, mock_open, mock_exists):
-        """Test submitting for review"""
-        mock_open.return_value.__enter__.return_value.read.return_value = "mock_key"
-        
-        client = Client(
-            key_id=self.key_id,
-            issuer_id=self.issuer_id,
-            private_key_path=self.private_key_path
-        )
-        
-        client.versions.submit_for_review = MagicMock(return_value={'status': 'submitted'})
-        
-        result = client.submit_for_review('v123')
-        
-        self.assertEqual(result, {'status': 'submitted'})
-        client.versions.submit_for_review.assert_called_once_with('v123')
+    result = getattr(mock_client, client_method)(*args, **kwargs)
+    
+    assert result == ret
+    sub_method.assert_called_once_with(*args, **kwargs)
+
+
+def test_update_app_localizations(mock_client, stub_api, monkeypatch):
+    """Test updating app localizations"""
+    monkeypatch.setattr(mock_client, '_app_info_cache', {})
+    get_with_relations = stub_api('apps.get_with_relations', {
+        'data': {'id': 'app123'},
+        'appInfos': [{'id': 'info123'}]
+    })
+    bulk_update = stub_api('localizations.bulk_update', {'en-US': {'success': True}})
+    
+    localizations = {'en-US': {'name': 'Test App'}}
+    result = mock_client.update_app_localizations('app123', localizations)
+    
+    assert result == {'en-US': {'success': True}}
+    get_with_relations.assert_called_once_with('app123', ['appInfos'])
+    bulk_update.assert_called_once_with('info123', localizations)
+
+
+def test_update_app_localizations_no_info(mock_client, stub_api, monkeypatch):
+    """Test updating app localizations with no app info"""
+    monkeypatch.setattr(mock_client, '_app_info_cache', {})
+    stub_api('apps.get_with_relations', {'data': {'id': 'app123'}, 'appInfos': []})
+    
+    with pytest.raises(ValueError, match="No app info found"):
+        mock_client.update_app_localizations('app123', {})
+
+
+def test_update_app_localizations_caches_app_info(mock_client, stub_api, monkeypatch):
+    """Test the app info ID is looked up once across repeated updates"""
+    monkeypatch.setattr(mock_client, '_app_info_cache', {})
+    get_with_relations = stub_api('apps.get_with_relations', {
+        'data': {'id': 'app123'},
+        'appInfos': [{'id': 'info123'}]
+    })
+    bulk_update = stub_api('localizations.bulk_update', {})
+    
+    mock_client.update_app_localizations('app123', {})
+    mock_client.update_app_localizations('app123', {})
+    
+    get_with_relations.assert_called_once_with('app123', ['appInfos'])
+    assert bulk_update.call_count == 2
+    
+    mock_client.invalidate_app_info_cache('app123')
+    mock_client.update_app_localizations('app123', {})
+    assert get_with_relations.call_count == 2
 
 
-if __name__ == '__main__':
-    unittest.main()
+def test_batch_preserves_order_and_isolates_errors(mock_client, monkeypatch):
+    """Test batch returns per-operation results in input order"""
+    from app_store_connect.client import BatchResult
+    from app_store_connect.exceptions import NotFoundError
+    
+    def fake_get(path, params=None):
+        if path == 'missing':
+            raise NotFoundError(path)
+        return {'data': {'id': path}}
+    
+    monkeypatch.setattr(mock_client._raw, 'get', fake_get)
+    monkeypatch.setattr(mock_client._raw, 'patch', lambda path, data: {'data': data})
+    
+    results = mock_client.batch([
+        ('GET', 'apps/1'),
+        ('GET', 'missing'),
+        ('PATCH', 'apps/1', {'name': 'x'}),
+    ])
+    
+    assert results[0] == BatchResult(True, value={'data': {'id': 'apps/1'}})
+    assert not results[1].ok
+    assert isinstance(results[1].error, NotFoundError)
+    assert results[2].value == {'data': {'name': 'x'}}
+
+
+def test_get_version_bundle(mock_client, stub_api):
+    """Test the bundle combines the current version's related records"""
+    stub_api('apps.get_app', {'id': 'app123'})
+    stub_api('versions.get_current', {'id': 'v1'})
+    stub_api('versions.get_build', {'id': 'build1'})
+    stub_api('versions.get_phased_release', None)
+    get_localizations = stub_api('version_localizations.get_all', [{'id': 'loc1'}])
+    
+    bundle = mock_client.get_version_bundle('app123')
+    
+    assert bundle.version == {'id': 'v1'}
+    assert bundle.build == {'id': 'build1'}
+    assert bundle.phased_release is None
+    assert bundle.app == {'id': 'app123'}
+    get_localizations.assert_called_once_with('v1')
@@ -0,0 +1,186 @@
+"""
+Tests for localization bulk helpers
+"""
+
+import json
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app_store_connect.api.localizations import (
+    MAX_RATE_LIMIT_RETRIES,
+    AppStoreVersionLocalizationsAPI,
+    LocalizationsAPI,
+    _call_with_retry,
+    _run_bulk,
+)
+from app_store_connect.base import BaseAPI
+from app_store_connect.exceptions import RateLimitError, ValidationError
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def version_localizations(api_factory):
+    """AppStoreVersionLocalizationsAPI with a stub auth and an unused session"""
+    return api_factory(AppStoreVersionLocalizationsAPI)
+
+
+@pytest.mark.parametrize('api_class, path', [
+    (LocalizationsAPI, 'appInfos/parent1/appInfoLocalizations'),
+    (AppStoreVersionLocalizationsAPI, 'appStoreVersions/parent1/appStoreVersionLocalizations'),
+])
+def test_get_all_follows_pages(api_factory, api_class, path):
+    """Test get_all requests every page until no 'next' link is left"""
+    api = api_factory(api_class)
+    pages = [
+        {'data': [{'id': 'loc1'}], 'links': {'next': f'{BaseAPI.BASE_URL}{path}?cursor=2'}},
+        {'data': [{'id': 'loc2'}], 'links': {'next': f'{BaseAPI.BASE_URL}{path}?cursor=3'}},
+        {'data': [{'id': 'loc3'}], 'links': {}},
+    ]
+    
+    with patch.object(api, '_request', side_effect=pages) as mock_request:
+        localizations = api.get_all('parent1')
+    
+    assert [loc['id'] for loc in localizations] == ['loc1', 'loc2', 'loc3']
+    assert [c.args[1] for c in mock_request.call_args_list] == [
+        path, f'{path}?cursor=2', f'{path}?cursor=3'
+    ]
+
+
+@patch('app_store_connect.api.localizations.time.sleep')
+def test_call_with_retry_recovers_from_rate_limit(mock_sleep):
+    """Test a call rate limited twice is retried until it succeeds"""
+    call = MagicMock(side_effect=[
+        RateLimitError('API rate limit exceeded'),
+        RateLimitError('API rate limit exceeded', retry_after=3.0),
+        {'data': 'ok'},
+    ])
+    
+    assert _call_with_retry(call) == {'data': 'ok'}
+    assert call.call_count == 3
+    # Only the attempt without Retry-After backs off here
+    mock_sleep.assert_called_once_with(1)
+
+
+@patch('app_store_connect.api.localizations.time.sleep')
+def test_call_with_retry_gives_up(mock_sleep):
+    """Test the last RateLimitError is raised once retries run out"""
+    call = MagicMock(side_effect=RateLimitError('API rate limit exceeded'))
+    
+    with pytest.raises(RateLimitError):
+        _call_with_retry(call)
+    
+    assert call.call_count == MAX_RATE_LIMIT_RETRIES + 1
+    delays = [c.args[0] for c in mock_sleep.call_args_list]
+    assert delays == [2 ** i for i in range(MAX_RATE_LIMIT_RETRIES)]
+
+
+def test_call_with_retry_does_not_retry_other_errors():
+    """Test errors other than 429 are raised on the first attempt"""
+    call = MagicMock(side_effect=ValidationError('Invalid field value'))
+    
+    with pytest.raises(ValidationError):
+        _call_with_retry(call)
+    
+    call.assert_called_once()
+
+
+def test_run_bulk_keys_results_by_task():
+    """Test results land on their own locale when calls finish out of order"""
+    last_done = threading.Event()
+    
+    def slow():
+        assert last_done.wait(5)
+        return {'id': 'first'}
+    
+    def fast():
+        last_done.set()
+        return {'id': 'last'}
+    
+    result = _run_bulk([
+        ('en-US', 'updated', slow),
+        ('fr-FR', 'noop', None),
+        ('de-DE', 'created', fast),
+    ], max_workers=3)
+    
+    assert list(result) == ['en-US', 'fr-FR', 'de-DE']
+    assert result['en-US'] == {'success': True, 'action': 'updated', 'data': {'id': 'first'}}
+    assert result['fr-FR'] == {'success': True, 'action': 'noop', 'data': None}
+    assert result['de-DE'] == {'success': True, 'action': 'created', 'data': {'id': 'last'}}
+
+
+def test_run_bulk_isolates_failures():
+    """Test one failing locale does not affect the others"""
+    def fail():
+        raise ValidationError('Description too long')
+    
+    result = _run_bulk([
+        ('en-US', 'updated', lambda: {'id': 'en'}),
+        ('fr-FR', 'updated', fail),
+        ('de-DE', 'created', lambda: {'id': 'de'}),
+    ], max_workers=2)
+    
+    assert result.failed() == ['fr-FR']
+    assert result['fr-FR'] == {'success': False, 'error': 'Description too long'}
+    assert result['en-US']['data'] == {'id': 'en'}
+    assert result['de-DE']['data'] == {'id': 'de'}
+
+
+def test_version_bulk_update_splits_creates_and_updates(version_localizations, monkeypatch):
+    """Test existing locales are patched with changed fields and new ones created"""
+    monkeypatch.setattr(version_localizations, 'get_all_hydrated', MagicMock(return_value=[
+        {'id': 'loc-en', 'attributes': {
+            'locale': 'en-US', 'description': 'Same', 'whatsNew': 'Old'
+        }},
+        {'id': 'loc-fr', 'attributes': {'locale': 'fr-FR', 'description': 'Pareil'}},
+    ]))
+    create = MagicMock(return_value={'id': 'loc-de'})
+    update = MagicMock(return_value={'id': 'loc-en'})
+    monkeypatch.setattr(version_localizations, 'create', create)
+    monkeypatch.setattr(version_localizations, 'update', update)
+    
+    result = version_localizations.bulk_update_result('v1', {
+        'en-US': {'description': 'Same', 'whats_new': 'New'},
+        'fr-FR': {'description': 'Pareil'},
+        'de-DE': {'description': 'Neu'},
+    })
+    
+    update.assert_called_once_with('loc-en', whats_new='New')
+    create.assert_called_once_with('v1', 'de-DE', description='Neu')
+    assert result.actions == ['updated', 'unchanged', 'created']
+    assert result.failed() == []
+    assert result['de-DE']['data'] == {'id': 'loc-de'}
+
+
+def test_version_bulk_update_reports_failed_locale(version_localizations, monkeypatch):
+    """Test a failed create is reported while other locales succeed"""
+    monkeypatch.setattr(version_localizations, 'get_all_hydrated', MagicMock(return_value=[
+        {'id': 'loc-en', 'attributes': {'locale': 'en-US', 'description': 'Old'}},
+    ]))
+    monkeypatch.setattr(version_localizations, 'create',
+                        MagicMock(side_effect=ValidationError('Locale not supported')))
+    monkeypatch.setattr(version_localizations, 'update', MagicMock(return_value={'id': 'loc-en'}))
+    
+    result = version_localizations.bulk_update_result('v1', {
+        'en-US': {'description': 'New'},
+        'xx-XX': {'description': 'Bad'},
+    })
+    
+    assert result.failed() == ['xx-XX']
+    assert result['xx-XX']['error'] == 'Locale not supported'
+    assert result['en-US'] == {'success': True, 'action': 'updated', 'data': {'id': 'loc-en'}}
+
+
+def test_version_bulk_update_returns_plain_dict(version_localizations, monkeypatch):
+    """Test bulk_update keeps returning a mutable, JSON-serializable dict"""
+    monkeypatch.setattr(version_localizations, 'get_all_hydrated', MagicMock(return_value=[]))
+    monkeypatch.setattr(version_localizations, 'create', MagicMock(return_value={'id': 'loc-de'}))
+    
+    result = version_localizations.bulk_update('v1', {'de-DE': {'description': 'Neu'}})
+    
+    assert type(result) is dict
+    assert json.loads(json.dumps(result)) == {
+        'de-DE': {'success': True, 'action': 'created', 'data': {'id': 'loc-de'}}
+    }
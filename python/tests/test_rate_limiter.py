@@ -0,0 +1,98 @@
+"""
+Tests for rate limiter
+"""
+
+import unittest
+import pytest
+from unittest.mock import patch
+import os
+
+from app_store_connect.rate_limiter import RateLimiter
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for RateLimiter class"""
+    
+    @patch('app_store_connect.rate_limiter.time.sleep')
+    def test_burst_then_pace(self, mock_sleep):
+        """Test burst requests pass immediately and the next one waits"""
+        with patch('app_store_connect.rate_limiter.time.monotonic', return_value=100.0):
+            limiter = RateLimiter(rate_per_sec=2, burst=3)
+            for _ in range(3):
+                limiter.acquire()
+            mock_sleep.assert_not_called()
+            
+            limiter.acquire()
+        
+        mock_sleep.assert_called_once_with(0.5)
+    
+    @patch('app_store_connect.rate_limiter.time.sleep')
+    def test_refill_over_time(self, mock_sleep):
+        """Test tokens accrue with elapsed time"""
+        with patch('app_store_connect.rate_limiter.time.monotonic', return_value=100.0):
+            limiter = RateLimiter(rate_per_sec=1, burst=1)
+            limiter.acquire()
+        
+        with patch('app_store_connect.rate_limiter.time.monotonic', return_value=101.0):
+            limiter.acquire()
+        
+        mock_sleep.assert_not_called()
+    
+    @patch('app_store_connect.rate_limiter.time.sleep')
+    def test_pause_holds_callers(self, mock_sleep):
+        """Test a pause drains the bucket and delays the next token"""
+        with patch('app_store_connect.rate_limiter.time.monotonic', return_value=100.0):
+            limiter = RateLimiter(rate_per_sec=2, burst=3)
+            limiter.pause(5)
+            limiter.acquire()
+        
+        mock_sleep.assert_called_once_with(5.5)
+    
+    @patch('app_store_connect.rate_limiter.time.sleep')
+    def test_sleeps_without_holding_lock(self, mock_sleep):
+        """Test a waiting caller leaves the lock free for others and pause()"""
+        with patch('app_store_connect.rate_limiter.time.monotonic', return_value=100.0):
+            limiter = RateLimiter(rate_per_sec=1, burst=1)
+            mock_sleep.side_effect = lambda seconds: self.assertFalse(limiter._lock.locked())
+            limiter.acquire()
+            limiter.acquire()
+            limiter.acquire()
+        
+        # Each waiter reserved its own place in line
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [1.0, 2.0])
+    
+    def test_default_rate(self):
+        """Test the default paces at 50 requests per second with a burst of 100"""
+        with patch.dict(os.environ, {}, clear=True):
+            limiter = RateLimiter.from_env()
+        
+        self.assertEqual(limiter.rate, 50)
+        self.assertEqual(limiter.capacity, 100)
+    
+    def test_shared_per_key(self):
+        """Test shared() returns one limiter per key"""
+        first = RateLimiter.shared('test.example.com')
+        
+        self.assertIs(RateLimiter.shared('test.example.com'), first)
+        self.assertIsNot(RateLimiter.shared('other.example.com'), first)
+    
+    @patch.dict(os.environ, {'ASC_RATE_LIMIT': '120'})
+    def test_from_env(self):
+        """Test ASC_RATE_LIMIT is read as requests per minute"""
+        limiter = RateLimiter.from_env()
+        
+        self.assertEqual(limiter.rate, 2)
+        self.assertEqual(limiter.capacity, RateLimiter.DEFAULT_BURST)
+    
+    @patch.dict(os.environ, {'ASC_RATE_LIMIT': 'fast'})
+    def test_from_env_invalid(self):
+        """Test a non-numeric ASC_RATE_LIMIT is rejected"""
+        with self.assertRaises(ValueError):
+            RateLimiter.from_env()
+
+
+if __name__ == '__main__':
+    unittest.main()
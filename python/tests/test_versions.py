@@ -0,0 +1,95 @@
+"""
+Tests for versions API
+"""
+
+import pytest
+from unittest.mock import patch
+
+from app_store_connect.api.versions import VersionsAPI
+from app_store_connect.base import BaseAPI
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def versions_api(api_factory):
+    """VersionsAPI with a stub auth and an unused session"""
+    return api_factory(VersionsAPI)
+
+
+@pytest.fixture
+def mock_request(versions_api):
+    """Capture every request VersionsAPI sends"""
+    with patch.object(versions_api, '_request', return_value={'data': {'id': 'v1'}}) as mock:
+        yield mock
+
+
+def test_get_all_follows_pages(versions_api):
+    """Test get_all requests every page until no 'next' link is left"""
+    path = 'apps/app123/appStoreVersions'
+    pages = [
+        {'data': [{'id': 'v3'}], 'links': {'next': f'{BaseAPI.BASE_URL}{path}?cursor=2'}},
+        {'data': [{'id': 'v2'}, {'id': 'v1'}]},
+    ]
+    
+    with patch.object(versions_api, '_request', side_effect=pages) as mock_request:
+        versions = versions_api.get_all('app123')
+    
+    assert [version['id'] for version in versions] == ['v3', 'v2', 'v1']
+    assert [c.args[1] for c in mock_request.call_args_list] == [path, f'{path}?cursor=2']
+    assert mock_request.call_args_list[0].kwargs['params'] == {'limit': 200}
+
+
+def test_create_body(versions_api, mock_request):
+    """Test create sends the app relationship and drops empty optional fields"""
+    versions_api.create('app123', '2.0', copyright='', release_type='MANUAL')
+    
+    mock_request.assert_called_once_with('POST', 'appStoreVersions', data={'data': {
+        'type': 'appStoreVersions',
+        'attributes': {'versionString': '2.0', 'platform': 'IOS', 'releaseType': 'MANUAL'},
+        'relationships': {'app': {'data': {'type': 'apps', 'id': 'app123'}}}
+    }})
+
+
+def test_update_body(versions_api, mock_request):
+    """Test update sends only given attributes and keeps False values"""
+    versions_api.update('v1', copyright='2026 Example', uses_idfa=False)
+    
+    mock_request.assert_called_once_with('PATCH', 'appStoreVersions/v1', data={'data': {
+        'type': 'appStoreVersions',
+        'id': 'v1',
+        'attributes': {'copyright': '2026 Example', 'usesIdfa': False}
+    }})
+
+
+def test_phased_release_bodies(versions_api, mock_request):
+    """Test phased release writes link or address the right resource"""
+    versions_api.create_phased_release('v1')
+    versions_api.update_phased_release('pr1', 'ACTIVE')
+    
+    assert mock_request.call_args_list[0].kwargs['data'] == {'data': {
+        'type': 'appStoreVersionPhasedReleases',
+        'attributes': {'phasedReleaseState': 'INACTIVE'},
+        'relationships': {'appStoreVersion': {'data': {'type': 'appStoreVersions', 'id': 'v1'}}}
+    }}
+    assert mock_request.call_args_list[1].kwargs['data'] == {'data': {
+        'type': 'appStoreVersionPhasedReleases',
+        'id': 'pr1',
+        'attributes': {'phasedReleaseState': 'ACTIVE'}
+    }}
+
+
+@pytest.mark.parametrize('body', [{'data': None}, {'data': {}}, {}])
+def test_empty_to_one_relationship_is_none(versions_api, body):
+    """Test a missing build or phased release comes back as None"""
+    with patch.object(versions_api, '_request', return_value=body):
+        assert versions_api.get_build('v1') is None
+        assert versions_api.get_phased_release('v1') is None
+
+
+def test_to_one_relationship_data(versions_api):
+    """Test a linked build is returned as its resource"""
+    build = {'type': 'builds', 'id': 'b1'}
+    with patch.object(versions_api, '_request', return_value={'data': build}):
+        assert versions_api.get_build('v1') == build